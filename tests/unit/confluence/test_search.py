@@ -1,33 +1,89 @@
 """Unit tests for the SearchMixin class."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call
 
 import pytest
 import requests
+from atlassian import Confluence
 from requests import HTTPError
 
 from mcp_atlassian.confluence.search import SearchMixin
 from mcp_atlassian.confluence.utils import quote_cql_identifier_if_needed
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 
+# Quoted space keys used in the expected CQL queries below
+_Q_DEV = quote_cql_identifier_if_needed("DEV")
+_Q_TEAM = quote_cql_identifier_if_needed("TEAM")
+_Q_OVERRIDE = quote_cql_identifier_if_needed("OVERRIDE")
+
+# User search API responses: a full Cloud payload and a minimal one
+_USER_PAYLOAD_FULL = {
+    "results": [
+        {
+            "user": {
+                "type": "known",
+                "accountId": "1234asdf",
+                "accountType": "atlassian",
+                "email": "first.last@example.com",
+                "publicName": "First Last",
+                "displayName": "First Last",
+                "isExternalCollaborator": False,
+                "profilePicture": {
+                    "path": "/wiki/aa-avatar/1234asdf",
+                    "width": 48,
+                    "height": 48,
+                    "isDefault": False,
+                },
+            },
+            "title": "First Last",
+            "excerpt": "",
+            "url": "/people/1234asdf",
+            "entityType": "user",
+            "lastModified": "2025-06-02T13:35:59.680Z",
+            "score": 0.0,
+        }
+    ],
+    "start": 0,
+    "limit": 25,
+    "size": 1,
+    "totalSize": 1,
+    "cqlQuery": "( user.fullname ~ 'First Last' )",
+    "searchDuration": 115,
+}
+_USER_PAYLOAD_MIN = {
+    "results": [
+        {
+            "user": {
+                "accountId": "test-account-id",
+                "displayName": "Test User",
+                "email": "test@example.com",
+                "isExternalCollaborator": False,
+            },
+            "title": "Test User",
+            "entityType": "user",
+            "score": 1.5,
+        }
+    ],
+    "start": 0,
+    "limit": 10,
+    "totalSize": 1,
+}
+
 
 class TestSearchMixin:
     """Tests for the SearchMixin class."""
 
     @pytest.fixture
-    def search_mixin(self, confluence_client):
+    def search_mixin(self, mock_config, mock_preprocessor):
         """Create a SearchMixin instance for testing."""
-        # SearchMixin inherits from ConfluenceClient, so we need to create it properly
-        with patch(
-            "mcp_atlassian.confluence.search.ConfluenceClient.__init__"
-        ) as mock_init:
-            mock_init.return_value = None
-            mixin = SearchMixin()
-            # Copy the necessary attributes from our mocked client
-            mixin.confluence = confluence_client.confluence
-            mixin.config = confluence_client.config
-            mixin.preprocessor = confluence_client.preprocessor
-            return mixin
+        # SearchMixin inherits from ConfluenceClient; skip its __init__ entirely
+        # instead of patching it, then attach the attributes the mixin uses
+        mixin = SearchMixin.__new__(SearchMixin)
+        # Only the API client needs to be a mock; the config is a plain dataclass
+        mixin.confluence = MagicMock(spec=Confluence)
+        mixin.config = mock_config
+        mixin.preprocessor = mock_preprocessor
+        return mixin
 
     def test_search_success(self, search_mixin):
         """Test search with successful results."""
@@ -149,9 +205,24 @@ class TestSearchMixin:
         assert isinstance(results, list)
         assert len(results) == 0
 
-    def test_search_with_spaces_filter(self, search_mixin):
+    @pytest.mark.parametrize(
+        "spaces_filter,query,expected_cql",
+        [
+            ("DEV", "test query", f"(test query) AND (space = {_Q_DEV})"),
+            (
+                "DEV,TEAM",
+                "test query",
+                f"(test query) AND (space = {_Q_DEV} OR space = {_Q_TEAM})",
+            ),
+            # Should not add filter when query already has a space clause
+            ("DEV", 'space = "EXISTING"', 'space = "EXISTING"'),
+        ],
+        ids=["single-space", "multiple-spaces", "existing-space-clause"],
+    )
+    def test_search_with_spaces_filter(
+        self, search_mixin, spaces_filter, query, expected_cql
+    ):
         """Test searching with spaces filter from parameter."""
-        # Prepare the mock
         search_mixin.confluence.cql.return_value = {
             "results": [
                 {
@@ -168,44 +239,12 @@ class TestSearchMixin:
             ]
         }
 
-        # Mock the preprocessor
-        search_mixin.preprocessor.process_html_content.return_value = (
-            "<p>Processed HTML</p>",
-            "Processed content",
-        )
-
-        # Test with single space filter
-        result = search_mixin.search("test query", spaces_filter="DEV")
-
-        # Verify space was properly quoted in the CQL query
-        quoted_dev = quote_cql_identifier_if_needed("DEV")
-        search_mixin.confluence.cql.assert_called_with(
-            cql=f"(test query) AND (space = {quoted_dev})",
-            limit=10,
-        )
-        assert len(result) == 1
-
-        # Test with multiple spaces filter
-        result = search_mixin.search("test query", spaces_filter="DEV,TEAM")
+        result = search_mixin.search(query, spaces_filter=spaces_filter)
 
-        # Verify spaces were properly quoted in the CQL query
-        quoted_dev = quote_cql_identifier_if_needed("DEV")
-        quoted_team = quote_cql_identifier_if_needed("TEAM")
-        search_mixin.confluence.cql.assert_called_with(
-            cql=f"(test query) AND (space = {quoted_dev} OR space = {quoted_team})",
-            limit=10,
-        )
+        assert search_mixin.confluence.cql.call_args == call(cql=expected_cql, limit=10)
         assert len(result) == 1
 
-        # Test with filter when query already has space
-        result = search_mixin.search('space = "EXISTING"', spaces_filter="DEV")
-        search_mixin.confluence.cql.assert_called_with(
-            cql='space = "EXISTING"',  # Should not add filter when space already exists
-            limit=10,
-        )
-        assert len(result) == 1
-
-    def test_search_with_config_spaces_filter(self, search_mixin):
+    def test_search_with_config_spaces_filter(self, search_mixin, monkeypatch):
         """Test search using spaces filter from config."""
         # Prepare the mock
         search_mixin.confluence.cql.return_value = {
@@ -224,23 +263,15 @@ class TestSearchMixin:
             ]
         }
 
-        # Mock the preprocessor
-        search_mixin.preprocessor.process_html_content.return_value = (
-            "<p>Processed HTML</p>",
-            "Processed content",
-        )
-
         # Set config filter
-        search_mixin.config.spaces_filter = "DEV,TEAM"
+        monkeypatch.setattr(search_mixin.config, "spaces_filter", "DEV,TEAM")
 
         # Test with config filter
         result = search_mixin.search("test query")
 
         # Verify spaces were properly quoted in the CQL query
-        quoted_dev = quote_cql_identifier_if_needed("DEV")
-        quoted_team = quote_cql_identifier_if_needed("TEAM")
         search_mixin.confluence.cql.assert_called_with(
-            cql=f"(test query) AND (space = {quoted_dev} OR space = {quoted_team})",
+            cql=f"(test query) AND (space = {_Q_DEV} OR space = {_Q_TEAM})",
             limit=10,
         )
         assert len(result) == 1
@@ -249,9 +280,8 @@ class TestSearchMixin:
         result = search_mixin.search("test query", spaces_filter="OVERRIDE")
 
         # Verify space was properly quoted in the CQL query
-        quoted_override = quote_cql_identifier_if_needed("OVERRIDE")
         search_mixin.confluence.cql.assert_called_with(
-            cql=f"(test query) AND (space = {quoted_override})",
+            cql=f"(test query) AND (space = {_Q_OVERRIDE})",
             limit=10,
         )
         assert len(result) == 1
@@ -268,100 +298,51 @@ class TestSearchMixin:
         assert isinstance(results, list)
         assert len(results) == 0
 
-    def test_search_user_success(self, search_mixin):
-        """Test search_user with successful results."""
-        # Prepare the mock response
-        search_mixin.confluence.get.return_value = {
-            "results": [
+    @pytest.mark.parametrize(
+        "payload,query,expected",
+        [
+            (
+                _USER_PAYLOAD_FULL,
+                'user.fullname ~ "First Last"',
                 {
-                    "user": {
-                        "type": "known",
-                        "accountId": "1234asdf",
-                        "accountType": "atlassian",
-                        "email": "first.last@example.com",
-                        "publicName": "First Last",
-                        "displayName": "First Last",
-                        "isExternalCollaborator": False,
-                        "profilePicture": {
-                            "path": "/wiki/aa-avatar/1234asdf",
-                            "width": 48,
-                            "height": 48,
-                            "isDefault": False,
-                        },
-                    },
+                    "account_id": "1234asdf",
+                    "display_name": "First Last",
+                    "email": "first.last@example.com",
                     "title": "First Last",
-                    "excerpt": "",
-                    "url": "/people/1234asdf",
-                    "entityType": "user",
-                    "lastModified": "2025-06-02T13:35:59.680Z",
-                    "score": 0.0,
-                }
-            ],
-            "start": 0,
-            "limit": 25,
-            "size": 1,
-            "totalSize": 1,
-            "cqlQuery": "( user.fullname ~ 'First Last' )",
-            "searchDuration": 115,
-        }
+                },
+            ),
+            (
+                _USER_PAYLOAD_MIN,
+                'user.fullname ~ "Test User"',
+                {
+                    "account_id": "test-account-id",
+                    "display_name": "Test User",
+                    "email": "test@example.com",
+                    "title": "Test User",
+                },
+            ),
+        ],
+        ids=["full-payload", "minimal-payload"],
+    )
+    def test_search_user_success(self, search_mixin, payload, query, expected):
+        """Test that search_user processes and returns user search result objects."""
+        search_mixin.confluence.get.return_value = payload
 
         # Call the method
-        result = search_mixin.search_user('user.fullname ~ "First Last"')
+        results = search_mixin.search_user(query)
 
         # Verify API call
-        search_mixin.confluence.get.assert_called_once_with(
-            "rest/api/search/user",
-            params={"cql": 'user.fullname ~ "First Last"', "limit": 10},
-        )
+        assert search_mixin.confluence.get.call_args_list == [
+            call("rest/api/search/user", params={"cql": query, "limit": 10})
+        ]
 
-        # Verify result
-        assert len(result) == 1
-        assert result[0].user.account_id == "1234asdf"
-        assert result[0].user.display_name == "First Last"
-        assert result[0].user.email == "first.last@example.com"
-        assert result[0].title == "First Last"
-        assert result[0].entity_type == "user"
-
-    def test_search_user_with_empty_results(self, search_mixin):
-        """Test search_user with empty results."""
-        # Mock an empty result set
-        search_mixin.confluence.get.return_value = {
-            "results": [],
-            "start": 0,
-            "limit": 25,
-            "size": 0,
-            "totalSize": 0,
-            "cqlQuery": 'user.fullname ~ "Nonexistent"',
-            "searchDuration": 50,
-        }
-
-        # Act
-        results = search_mixin.search_user('user.fullname ~ "Nonexistent"')
-
-        # Assert
-        assert isinstance(results, list)
-        assert len(results) == 0
-
-    def test_search_user_with_custom_limit(self, search_mixin):
-        """Test search_user with custom limit."""
-        # Prepare the mock response
-        search_mixin.confluence.get.return_value = {
-            "results": [],
-            "start": 0,
-            "limit": 5,
-            "size": 0,
-            "totalSize": 0,
-            "cqlQuery": 'user.fullname ~ "Test"',
-            "searchDuration": 30,
-        }
-
-        # Call with custom limit
-        search_mixin.search_user('user.fullname ~ "Test"', limit=5)
-
-        # Verify API call with correct limit
-        search_mixin.confluence.get.assert_called_once_with(
-            "rest/api/search/user", params={"cql": 'user.fullname ~ "Test"', "limit": 5}
-        )
+        # Verify result structure
+        assert len(results) == 1
+        assert results[0].user.account_id == expected["account_id"]
+        assert results[0].user.display_name == expected["display_name"]
+        assert results[0].user.email == expected["email"]
+        assert results[0].title == expected["title"]
+        assert results[0].entity_type == "user"
 
     @pytest.mark.parametrize(
         "exception_type,exception_args,expected_result",
@@ -392,12 +373,11 @@ class TestSearchMixin:
         [
             (401, MCPAtlassianAuthenticationError),
             (403, MCPAtlassianAuthenticationError),
+            (500, HTTPError),  # Other HTTP errors are re-raised unchanged
         ],
     )
-    def test_search_user_http_auth_errors(
-        self, search_mixin, status_code, exception_type
-    ):
-        """Test search_user handling of HTTP authentication errors."""
+    def test_search_user_http_errors(self, search_mixin, status_code, exception_type):
+        """Test search_user handling of HTTP errors."""
         # Mock HTTP error
         mock_response = MagicMock()
         mock_response.status_code = status_code
@@ -409,35 +389,53 @@ class TestSearchMixin:
         with pytest.raises(exception_type):
             search_mixin.search_user('user.fullname ~ "Test"')
 
-    def test_search_user_http_other_error(self, search_mixin):
-        """Test search_user handling of other HTTP errors."""
-        # Mock HTTP 500 error
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        http_error = HTTPError("Internal Server Error")
-        http_error.response = mock_response
-        search_mixin.confluence.get.side_effect = http_error
-
-        # Act and assert - should re-raise the HTTPError
-        with pytest.raises(HTTPError):
-            search_mixin.search_user('user.fullname ~ "Test"')
-
     @pytest.mark.parametrize(
-        "mock_response,expected_length",
+        "mock_response,limit,expected_length",
         [
-            ({"incomplete": "data"}, 0),  # KeyError case
-            (None, 0),  # None response case
-            ({"results": []}, 0),  # Empty results case
+            ({"incomplete": "data"}, 10, 0),  # KeyError case
+            (None, 10, 0),  # None response case
+            (
+                {
+                    "results": [],
+                    "start": 0,
+                    "limit": 25,
+                    "size": 0,
+                    "totalSize": 0,
+                    "cqlQuery": 'user.fullname ~ "Test"',
+                    "searchDuration": 50,
+                },
+                10,
+                0,
+            ),  # Empty results case
+            (
+                {
+                    "results": [],
+                    "start": 0,
+                    "limit": 5,
+                    "size": 0,
+                    "totalSize": 0,
+                    "cqlQuery": 'user.fullname ~ "Test"',
+                    "searchDuration": 30,
+                },
+                5,
+                0,
+            ),  # Custom limit case
         ],
     )
-    def test_search_user_edge_cases(self, search_mixin, mock_response, expected_length):
+    def test_search_user_edge_cases(
+        self, search_mixin, mock_response, limit, expected_length
+    ):
         """Test search_user handling of edge cases in API responses."""
         search_mixin.confluence.get.return_value = mock_response
 
         # Act
-        results = search_mixin.search_user('user.fullname ~ "Test"')
+        results = search_mixin.search_user('user.fullname ~ "Test"', limit=limit)
 
         # Assert
+        search_mixin.confluence.get.assert_called_once_with(
+            "rest/api/search/user",
+            params={"cql": 'user.fullname ~ "Test"', "limit": limit},
+        )
         assert isinstance(results, list)
         assert len(results) == expected_length
 
@@ -468,30 +466,39 @@ class TestSearchMixin:
 
     # Parametrize CQL query tests:
     @pytest.mark.parametrize(
-        "query,limit,expected_params",
+        "query,limit,expected_call",
         [
             (
                 'user.fullname ~ "Test"',
                 10,
-                {"cql": 'user.fullname ~ "Test"', "limit": 10},
+                call(
+                    "rest/api/search/user",
+                    params={"cql": 'user.fullname ~ "Test"', "limit": 10},
+                ),
             ),
             (
                 'user.email ~ "test@example.com"',
                 5,
-                {"cql": 'user.email ~ "test@example.com"', "limit": 5},
+                call(
+                    "rest/api/search/user",
+                    params={"cql": 'user.email ~ "test@example.com"', "limit": 5},
+                ),
             ),
             (
                 'user.fullname ~ "John" AND user.email ~ "@company.com"',
                 15,
-                {
-                    "cql": 'user.fullname ~ "John" AND user.email ~ "@company.com"',
-                    "limit": 15,
-                },
+                call(
+                    "rest/api/search/user",
+                    params={
+                        "cql": 'user.fullname ~ "John" AND user.email ~ "@company.com"',
+                        "limit": 15,
+                    },
+                ),
             ),
         ],
     )
     def test_search_user_api_parameters(
-        self, search_mixin, query, limit, expected_params
+        self, search_mixin, query, limit, expected_call
     ):
         """Test that search_user calls the API with correct parameters."""
         # Mock successful response
@@ -505,10 +512,8 @@ class TestSearchMixin:
         # Act
         search_mixin.search_user(query, limit=limit)
 
-        # Assert API was called with correct parameters
-        search_mixin.confluence.get.assert_called_once_with(
-            "rest/api/search/user", params=expected_params
-        )
+        # Assert API was called exactly once with correct parameters
+        assert search_mixin.confluence.get.call_args_list == [expected_call]
 
     def test_search_user_with_complex_cql_query(self, search_mixin):
         """Test search_user with complex CQL query containing operators."""
@@ -529,38 +534,3 @@ class TestSearchMixin:
         search_mixin.confluence.get.assert_called_once_with(
             "rest/api/search/user", params={"cql": complex_query, "limit": 10}
         )
-
-    def test_search_user_result_processing(self, search_mixin):
-        """Test that search_user properly processes and returns user search result objects."""
-        # Mock response with user data
-        search_mixin.confluence.get.return_value = {
-            "results": [
-                {
-                    "user": {
-                        "accountId": "test-account-id",
-                        "displayName": "Test User",
-                        "email": "test@example.com",
-                        "isExternalCollaborator": False,
-                    },
-                    "title": "Test User",
-                    "entityType": "user",
-                    "score": 1.5,
-                }
-            ],
-            "start": 0,
-            "limit": 10,
-            "totalSize": 1,
-        }
-
-        # Act
-        results = search_mixin.search_user('user.fullname ~ "Test User"')
-
-        # Assert result structure
-        assert len(results) == 1
-        assert hasattr(results[0], "user")
-        assert hasattr(results[0], "title")
-        assert hasattr(results[0], "entity_type")
-        assert results[0].user.account_id == "test-account-id"
-        assert results[0].user.display_name == "Test User"
-        assert results[0].title == "Test User"
-        assert results[0].entity_type == "user"
@@ -1,227 +1,224 @@
 """Unit tests for the Confluence users module."""
 
+import inspect
+import re
 from unittest.mock import MagicMock, patch
 
 import pytest
 from requests.exceptions import HTTPError
 
+from mcp_atlassian.confluence.client import ConfluenceClient
+from mcp_atlassian.confluence.config import ConfluenceConfig
 from mcp_atlassian.confluence.users import UsersMixin
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 
+# Expected error messages, compiled once for pytest.raises(match=...)
+_MATCH_USER_NOT_FOUND = re.compile("User not found")
+_MATCH_INVALID_JSON = re.compile(
+    "Confluence token validation failed: Did not receive valid JSON user data"
+)
+_MATCH_HTTP_401 = re.compile(
+    "Confluence token validation failed: 401 from /rest/api/user/current"
+)
+_MATCH_HTTP_403 = re.compile(
+    "Confluence token validation failed: 403 from /rest/api/user/current"
+)
+_MATCH_HTTP_ERROR = re.compile("Confluence token validation failed with HTTPError")
+_MATCH_NETWORK_ERROR = re.compile("Confluence token validation failed: Network error")
+
+# Mock user data for different scenarios, built once at import time
+_MOCK_USER_DATA_CLOUD = {
+    "accountId": "5b10ac8d82e05b22cc7d4ef5",
+    "accountType": "atlassian",
+    "email": "user@example.com",
+    "publicName": "Test User",
+    "displayName": "Test User",
+    "profilePicture": {
+        "path": "/wiki/aa-avatar/5b10ac8d82e05b22cc7d4ef5",
+        "width": 48,
+        "height": 48,
+        "isDefault": False,
+    },
+    "isExternalCollaborator": False,
+    "accountStatus": "active",
+}
+
+_MOCK_USER_DATA_SERVER = {
+    "username": "testuser",
+    "userKey": "testuser-key-12345",
+    "displayName": "Test User",
+    "fullName": "Test User Full Name",
+    "email": "testuser@example.com",
+    "status": "active",
+}
+
+# User data as returned with the status expansion
+_MOCK_CLOUD_WITH_STATUS = {**_MOCK_USER_DATA_CLOUD, "status": "Active"}
+_MOCK_SERVER_WITH_STATUS = {**_MOCK_USER_DATA_SERVER, "status": "Active"}
+
+_MOCK_CURRENT_USER_DATA = {
+    "accountId": "5b10ac8d82e05b22cc7d4ef5",
+    "type": "known",
+    "accountType": "atlassian",
+    "email": "current@example.com",
+    "publicName": "Current User",
+    "displayName": "Current User",
+    "profilePicture": {
+        "path": "/wiki/aa-avatar/5b10ac8d82e05b22cc7d4ef5",
+        "width": 48,
+        "height": 48,
+        "isDefault": False,
+    },
+    "isExternalCollaborator": False,
+    "isGuest": False,
+    "locale": "en_US",
+    "accountStatus": "active",
+}
+
+
+@pytest.fixture(scope="session")
+def mock_user_data_cloud():
+    """Mock user data for Confluence Cloud."""
+    return _MOCK_USER_DATA_CLOUD
+
+
+@pytest.fixture(scope="session")
+def mock_user_data_server():
+    """Mock user data for Confluence Server/DC."""
+    return _MOCK_USER_DATA_SERVER
+
+
+@pytest.fixture(scope="session")
+def mock_current_user_data():
+    """Mock current user data for get_current_user_info."""
+    return _MOCK_CURRENT_USER_DATA
+
+
+@pytest.fixture(scope="module")
+def _stub_confluence_init():
+    """Stub out ConfluenceClient.__init__ once for the whole module."""
+    patcher = patch.object(ConfluenceClient, "__init__", return_value=None)
+    patcher.start()
+    yield
+    patcher.stop()
+
+
+@pytest.fixture(scope="module")
+def _users_mixin_template(_stub_confluence_init):
+    """Create a single UsersMixin instance shared by all tests in this module.
+
+    Tests only reconfigure the mocked Confluence API, so the instance is built
+    once and the ``users_mixin`` fixture resets the mock before each test.
+    """
+    mixin = UsersMixin()
+    mixin.confluence = MagicMock()
+    mixin.config = ConfluenceConfig(
+        url="https://example.atlassian.net/wiki",
+        auth_type="basic",
+        username="test_user",
+        api_token="test_token",
+    )
+    return mixin
+
 
 class TestUsersMixin:
     """Tests for the UsersMixin class."""
 
     @pytest.fixture
-    def users_mixin(self, confluence_client):
-        """Create a UsersMixin instance for testing."""
-        # UsersMixin inherits from ConfluenceClient, so we need to create it properly
-        with patch(
-            "mcp_atlassian.confluence.users.ConfluenceClient.__init__"
-        ) as mock_init:
-            mock_init.return_value = None
-            mixin = UsersMixin()
-            # Copy the necessary attributes from our mocked client
-            mixin.confluence = confluence_client.confluence
-            mixin.config = confluence_client.config
-            return mixin
-
-    # Mock user data for different scenarios
-    @pytest.fixture
-    def mock_user_data_cloud(self):
-        """Mock user data for Confluence Cloud."""
-        return {
-            "accountId": "5b10ac8d82e05b22cc7d4ef5",
-            "accountType": "atlassian",
-            "email": "user@example.com",
-            "publicName": "Test User",
-            "displayName": "Test User",
-            "profilePicture": {
-                "path": "/wiki/aa-avatar/5b10ac8d82e05b22cc7d4ef5",
-                "width": 48,
-                "height": 48,
-                "isDefault": False,
-            },
-            "isExternalCollaborator": False,
-            "accountStatus": "active",
-        }
-
-    @pytest.fixture
-    def mock_user_data_server(self):
-        """Mock user data for Confluence Server/DC."""
-        return {
-            "username": "testuser",
-            "userKey": "testuser-key-12345",
-            "displayName": "Test User",
-            "fullName": "Test User Full Name",
-            "email": "testuser@example.com",
-            "status": "active",
-        }
-
-    @pytest.fixture
-    def mock_user_data_with_status(self):
-        """Mock user data with status expansion."""
-        return {
-            "accountId": "5b10ac8d82e05b22cc7d4ef5",
-            "accountType": "atlassian",
-            "email": "user@example.com",
-            "publicName": "Test User",
-            "displayName": "Test User",
-            "accountStatus": "active",
-            "status": "Active",  # Expanded status field
-        }
+    def users_mixin(self, _users_mixin_template):
+        """Provide the shared UsersMixin with a clean Confluence mock."""
+        _users_mixin_template.confluence.reset_mock(return_value=True, side_effect=True)
+        return _users_mixin_template
 
-    @pytest.fixture
-    def mock_current_user_data(self):
-        """Mock current user data for get_current_user_info."""
-        return {
-            "accountId": "5b10ac8d82e05b22cc7d4ef5",
-            "type": "known",
-            "accountType": "atlassian",
-            "email": "current@example.com",
-            "publicName": "Current User",
-            "displayName": "Current User",
-            "profilePicture": {
-                "path": "/wiki/aa-avatar/5b10ac8d82e05b22cc7d4ef5",
-                "width": 48,
-                "height": 48,
-                "isDefault": False,
-            },
-            "isExternalCollaborator": False,
-            "isGuest": False,
-            "locale": "en_US",
-            "accountStatus": "active",
-        }
-
-    def test_get_user_details_by_accountid_success(
-        self, users_mixin, mock_user_data_cloud
+    @pytest.mark.parametrize(
+        "account_id,expand,response",
+        [
+            pytest.param(
+                "5b10ac8d82e05b22cc7d4ef5", None, _MOCK_USER_DATA_CLOUD, id="success"
+            ),
+            pytest.param(
+                "5b10ac8d82e05b22cc7d4ef5",
+                "status",
+                _MOCK_CLOUD_WITH_STATUS,
+                id="with-expand",
+            ),
+            pytest.param(
+                "5b10ac8d82e05b22cc7d4ef5", "", _MOCK_USER_DATA_CLOUD, id="empty-expand"
+            ),
+            pytest.param(
+                "invalid-account-id",
+                None,
+                Exception("User not found"),
+                id="invalid-account-id",
+            ),
+        ],
+    )
+    def test_get_user_details_by_accountid(
+        self, users_mixin, account_id, expand, response
     ):
-        """Test successfully getting user details by account ID."""
-        # Arrange
-        account_id = "5b10ac8d82e05b22cc7d4ef5"
-        users_mixin.confluence.get_user_details_by_accountid.return_value = (
-            mock_user_data_cloud
-        )
-
-        # Act
-        result = users_mixin.get_user_details_by_accountid(account_id)
-
-        # Assert
-        users_mixin.confluence.get_user_details_by_accountid.assert_called_once_with(
-            account_id, None
-        )
-        assert result == mock_user_data_cloud
-        assert result["accountId"] == account_id
-        assert result["displayName"] == "Test User"
+        """Test getting user details by account ID."""
+        mock_get = users_mixin.confluence.get_user_details_by_accountid
+        if isinstance(response, Exception):
+            mock_get.side_effect = response
+            with pytest.raises(Exception, match=_MATCH_USER_NOT_FOUND):
+                users_mixin.get_user_details_by_accountid(account_id, expand=expand)
+            return
 
-    def test_get_user_details_by_accountid_with_expand(
-        self, users_mixin, mock_user_data_with_status
-    ):
-        """Test getting user details by account ID with status expansion."""
-        # Arrange
-        account_id = "5b10ac8d82e05b22cc7d4ef5"
-        expand = "status"
-        users_mixin.confluence.get_user_details_by_accountid.return_value = (
-            mock_user_data_with_status
-        )
+        mock_get.return_value = response
 
         # Act
         result = users_mixin.get_user_details_by_accountid(account_id, expand=expand)
 
         # Assert
-        users_mixin.confluence.get_user_details_by_accountid.assert_called_once_with(
-            account_id, expand
-        )
-        assert result == mock_user_data_with_status
-        assert result["status"] == "Active"
-        assert result["accountStatus"] == "active"
-
-    def test_get_user_details_by_accountid_invalid_account_id(self, users_mixin):
-        """Test getting user details with invalid account ID."""
-        # Arrange
-        invalid_account_id = "invalid-account-id"
-        users_mixin.confluence.get_user_details_by_accountid.side_effect = Exception(
-            "User not found"
-        )
-
-        # Act/Assert
-        with pytest.raises(Exception, match="User not found"):
-            users_mixin.get_user_details_by_accountid(invalid_account_id)
+        mock_get.assert_called_once_with(account_id, expand)
+        assert result == response
+        assert result["accountId"] == account_id
 
-    def test_get_user_details_by_username_success(
-        self, users_mixin, mock_user_data_server
+    @pytest.mark.parametrize(
+        "username,expand,response",
+        [
+            pytest.param("testuser", None, _MOCK_USER_DATA_SERVER, id="success"),
+            pytest.param(
+                "testuser",
+                "status",
+                _MOCK_SERVER_WITH_STATUS,
+                id="with-expand",
+            ),
+            pytest.param("testuser", "", _MOCK_USER_DATA_SERVER, id="empty-expand"),
+            # Email-like usernames are common in Server/DC
+            pytest.param(
+                "dc.user@example.com",
+                None,
+                _MOCK_USER_DATA_SERVER,
+                id="server-dc-pattern",
+            ),
+            pytest.param(
+                "nonexistent-user",
+                None,
+                Exception("User not found"),
+                id="invalid-username",
+            ),
+        ],
+    )
+    def test_get_user_details_by_username(
+        self, users_mixin, username, expand, response
     ):
-        """Test successfully getting user details by username."""
-        # Arrange
-        username = "testuser"
-        users_mixin.confluence.get_user_details_by_username.return_value = (
-            mock_user_data_server
-        )
+        """Test getting user details by username."""
+        mock_get = users_mixin.confluence.get_user_details_by_username
+        if isinstance(response, Exception):
+            mock_get.side_effect = response
+            with pytest.raises(Exception, match=_MATCH_USER_NOT_FOUND):
+                users_mixin.get_user_details_by_username(username, expand=expand)
+            return
 
-        # Act
-        result = users_mixin.get_user_details_by_username(username)
-
-        # Assert
-        users_mixin.confluence.get_user_details_by_username.assert_called_once_with(
-            username, None
-        )
-        assert result == mock_user_data_server
-        assert result["username"] == username
-        assert result["displayName"] == "Test User"
-
-    def test_get_user_details_by_username_with_expand(
-        self, users_mixin, mock_user_data_server
-    ):
-        """Test getting user details by username with status expansion."""
-        # Arrange
-        username = "testuser"
-        expand = "status"
-        mock_data_with_status = mock_user_data_server.copy()
-        mock_data_with_status["status"] = "Active"
-        users_mixin.confluence.get_user_details_by_username.return_value = (
-            mock_data_with_status
-        )
+        mock_get.return_value = response
 
         # Act
         result = users_mixin.get_user_details_by_username(username, expand=expand)
 
         # Assert
-        users_mixin.confluence.get_user_details_by_username.assert_called_once_with(
-            username, expand
-        )
-        assert result == mock_data_with_status
-        assert result["status"] == "Active"
-
-    def test_get_user_details_by_username_invalid_username(self, users_mixin):
-        """Test getting user details with invalid username."""
-        # Arrange
-        invalid_username = "nonexistent-user"
-        users_mixin.confluence.get_user_details_by_username.side_effect = Exception(
-            "User not found"
-        )
-
-        # Act/Assert
-        with pytest.raises(Exception, match="User not found"):
-            users_mixin.get_user_details_by_username(invalid_username)
-
-    def test_get_user_details_by_username_server_dc_pattern(
-        self, users_mixin, mock_user_data_server
-    ):
-        """Test that username lookup follows Server/DC patterns."""
-        # Arrange
-        username = "dc.user@example.com"  # Email-like username common in DC
-        users_mixin.confluence.get_user_details_by_username.return_value = (
-            mock_user_data_server
-        )
-
-        # Act
-        result = users_mixin.get_user_details_by_username(username)
-
-        # Assert
-        users_mixin.confluence.get_user_details_by_username.assert_called_once_with(
-            username, None
-        )
-        assert result == mock_user_data_server
+        mock_get.assert_called_once_with(username, expand)
+        assert result == response
 
     def test_get_current_user_info_success(self, users_mixin, mock_current_user_data):
         """Test successfully getting current user info."""
@@ -245,7 +242,7 @@ class TestUsersMixin:
         # Act/Assert
         with pytest.raises(
             MCPAtlassianAuthenticationError,
-            match="Confluence token validation failed: Did not receive valid JSON user data",
+            match=_MATCH_INVALID_JSON,
         ):
             users_mixin.get_current_user_info()
 
@@ -259,67 +256,31 @@ class TestUsersMixin:
         # Act/Assert
         with pytest.raises(
             MCPAtlassianAuthenticationError,
-            match="Confluence token validation failed: Did not receive valid JSON user data",
+            match=_MATCH_INVALID_JSON,
         ):
             users_mixin.get_current_user_info()
 
-    def test_get_current_user_info_http_error_401(self, users_mixin):
-        """Test get_current_user_info with 401 authentication error."""
-        # Arrange
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        http_error = HTTPError(response=mock_response)
-        users_mixin.confluence.get.side_effect = http_error
-
-        # Act/Assert
-        with pytest.raises(
-            MCPAtlassianAuthenticationError,
-            match="Confluence token validation failed: 401 from /rest/api/user/current",
-        ):
-            users_mixin.get_current_user_info()
-
-    def test_get_current_user_info_http_error_403(self, users_mixin):
-        """Test get_current_user_info with 403 forbidden error."""
-        # Arrange
-        mock_response = MagicMock()
-        mock_response.status_code = 403
-        http_error = HTTPError(response=mock_response)
-        users_mixin.confluence.get.side_effect = http_error
-
-        # Act/Assert
-        with pytest.raises(
-            MCPAtlassianAuthenticationError,
-            match="Confluence token validation failed: 403 from /rest/api/user/current",
-        ):
-            users_mixin.get_current_user_info()
-
-    def test_get_current_user_info_http_error_other(self, users_mixin):
-        """Test get_current_user_info with other HTTP error codes."""
-        # Arrange
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        http_error = HTTPError(response=mock_response)
-        users_mixin.confluence.get.side_effect = http_error
-
-        # Act/Assert
-        with pytest.raises(
-            MCPAtlassianAuthenticationError,
-            match="Confluence token validation failed with HTTPError",
-        ):
-            users_mixin.get_current_user_info()
-
-    def test_get_current_user_info_http_error_no_response(self, users_mixin):
-        """Test get_current_user_info with HTTPError but no response object."""
+    @pytest.mark.parametrize(
+        "status_code,match",
+        [
+            (401, _MATCH_HTTP_401),
+            (403, _MATCH_HTTP_403),
+            (500, _MATCH_HTTP_ERROR),
+            (None, _MATCH_HTTP_ERROR),
+        ],
+        ids=["401", "403", "other", "no-response"],
+    )
+    def test_get_current_user_info_http_errors(self, users_mixin, status_code, match):
+        """Test get_current_user_info with HTTP errors, with or without a response."""
         # Arrange
-        http_error = HTTPError()
-        http_error.response = None
-        users_mixin.confluence.get.side_effect = http_error
+        mock_response = None
+        if status_code is not None:
+            mock_response = MagicMock()
+            mock_response.status_code = status_code
+        users_mixin.confluence.get.side_effect = HTTPError(response=mock_response)
 
         # Act/Assert
-        with pytest.raises(
-            MCPAtlassianAuthenticationError,
-            match="Confluence token validation failed with HTTPError",
-        ):
+        with pytest.raises(MCPAtlassianAuthenticationError, match=match):
             users_mixin.get_current_user_info()
 
     def test_get_current_user_info_generic_exception(self, users_mixin):
@@ -330,75 +291,13 @@ class TestUsersMixin:
         # Act/Assert
         with pytest.raises(
             MCPAtlassianAuthenticationError,
-            match="Confluence token validation failed: Network error",
+            match=_MATCH_NETWORK_ERROR,
         ):
             users_mixin.get_current_user_info()
 
-    @pytest.mark.parametrize(
-        "expand_param",
-        [
-            None,
-            "status",
-            "",  # Empty string
-        ],
-    )
-    def test_get_user_details_by_accountid_expand_parameter_handling(
-        self, users_mixin, mock_user_data_cloud, expand_param
-    ):
-        """Test that expand parameter is properly handled for account ID lookup."""
-        # Arrange
-        account_id = "5b10ac8d82e05b22cc7d4ef5"
-        expected_data = mock_user_data_cloud.copy()
-        if expand_param == "status":
-            expected_data["status"] = "Active"
-
-        users_mixin.confluence.get_user_details_by_accountid.return_value = (
-            expected_data
-        )
-
-        # Act
-        result = users_mixin.get_user_details_by_accountid(account_id, expand_param)
-
-        # Assert
-        users_mixin.confluence.get_user_details_by_accountid.assert_called_once_with(
-            account_id, expand_param
-        )
-        assert result == expected_data
-
-    @pytest.mark.parametrize(
-        "expand_param",
-        [
-            None,
-            "status",
-            "",  # Empty string
-        ],
-    )
-    def test_get_user_details_by_username_expand_parameter_handling(
-        self, users_mixin, mock_user_data_server, expand_param
-    ):
-        """Test that expand parameter is properly handled for username lookup."""
-        # Arrange
-        username = "testuser"
-        expected_data = mock_user_data_server.copy()
-        if expand_param == "status":
-            expected_data["status"] = "Active"
-
-        users_mixin.confluence.get_user_details_by_username.return_value = expected_data
-
-        # Act
-        result = users_mixin.get_user_details_by_username(username, expand_param)
-
-        # Assert
-        users_mixin.confluence.get_user_details_by_username.assert_called_once_with(
-            username, expand_param
-        )
-        assert result == expected_data
-
     def test_users_mixin_inheritance(self, users_mixin):
         """Test that UsersMixin properly inherits from ConfluenceClient."""
         # Verify that UsersMixin is indeed a ConfluenceClient
-        from mcp_atlassian.confluence.client import ConfluenceClient
-
         assert isinstance(users_mixin, ConfluenceClient)
 
         # Verify it has the expected attributes from ConfluenceClient
@@ -412,30 +311,24 @@ class TestUsersMixin:
         assert hasattr(UsersMixin, "get_user_details_by_username")
         assert hasattr(UsersMixin, "get_current_user_info")
 
-        # Verify method signatures
-        import inspect
-
         # Check get_user_details_by_accountid signature
         sig = inspect.signature(UsersMixin.get_user_details_by_accountid)
-        params = list(sig.parameters.keys())
-        assert "self" in params
-        assert "account_id" in params
-        assert "expand" in params
+        assert "self" in sig.parameters
+        assert "account_id" in sig.parameters
+        assert "expand" in sig.parameters
         assert sig.parameters["expand"].default is None
 
         # Check get_user_details_by_username signature
         sig = inspect.signature(UsersMixin.get_user_details_by_username)
-        params = list(sig.parameters.keys())
-        assert "self" in params
-        assert "username" in params
-        assert "expand" in params
+        assert "self" in sig.parameters
+        assert "username" in sig.parameters
+        assert "expand" in sig.parameters
         assert sig.parameters["expand"].default is None
 
         # Check get_current_user_info signature
         sig = inspect.signature(UsersMixin.get_current_user_info)
-        params = list(sig.parameters.keys())
-        assert "self" in params
-        assert len(params) == 1  # Only self parameter
+        assert "self" in sig.parameters
+        assert len(sig.parameters) == 1  # Only self parameter
 
     def test_user_permission_scenarios(self, users_mixin):
         """Test various permission error scenarios."""
@@ -1,6 +1,6 @@
 """Unit tests for ConfluenceV2Adapter class."""
 
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, NonCallableMock
 
 import pytest
 import requests
@@ -8,14 +8,45 @@ from requests.exceptions import HTTPError
 
 from mcp_atlassian.confluence.v2_adapter import ConfluenceV2Adapter
 
+# v2 API payloads shared by the get_page tests
+_PAGE_JSON = {
+    "id": "123456",
+    "status": "current",
+    "title": "Test Page",
+    "spaceId": "789",
+    "version": {"number": 5},
+    "body": {"storage": {"value": "<p>Test content</p>", "representation": "storage"}},
+    "_links": {"webui": "/pages/viewpage.action?pageId=123456"},
+}
+_MINIMAL_PAGE_JSON = {"id": "123456", "status": "current", "title": "Minimal Page"}
+_SPACE_JSON = {"key": "TEST"}
+
+
+def _mk_response(json_payload, status=200):
+    """Build a mock HTTP response returning ``json_payload``."""
+    response = Mock()
+    response.status_code = status
+    response.json.return_value = json_payload
+    return response
+
+
+# Page lookup followed by the space key lookup, in call order
+_SUCCESS_RESPONSES = (_mk_response(_PAGE_JSON), _mk_response(_SPACE_JSON))
+
 
 class TestConfluenceV2Adapter:
     """Test cases for ConfluenceV2Adapter."""
 
     @pytest.fixture
     def mock_session(self):
-        """Create a mock session."""
-        return MagicMock(spec=requests.Session)
+        """Create a mock session.
+
+        The adapter tests only exercise ``session.get``, so a bare
+        non-callable mock with that one method is enough.
+        """
+        session = NonCallableMock()
+        session.get = MagicMock()
+        return session
 
     @pytest.fixture
     def v2_adapter(self, mock_session):
@@ -26,27 +57,8 @@ class TestConfluenceV2Adapter:
 
     def test_get_page_success(self, v2_adapter, mock_session):
         """Test successful page retrieval."""
-        # Mock the v2 API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "123456",
-            "status": "current",
-            "title": "Test Page",
-            "spaceId": "789",
-            "version": {"number": 5},
-            "body": {
-                "storage": {"value": "<p>Test content</p>", "representation": "storage"}
-            },
-            "_links": {"webui": "/pages/viewpage.action?pageId=123456"},
-        }
-        mock_session.get.return_value = mock_response
-
-        # Mock space key lookup
-        space_response = Mock()
-        space_response.status_code = 200
-        space_response.json.return_value = {"key": "TEST"}
-        mock_session.get.side_effect = [mock_response, space_response]
+        # Mock the v2 API page response followed by the space key lookup
+        mock_session.get.side_effect = iter(_SUCCESS_RESPONSES)
 
         # Call the method
         result = v2_adapter.get_page("123456")
@@ -84,14 +96,7 @@ class TestConfluenceV2Adapter:
     def test_get_page_with_minimal_response(self, v2_adapter, mock_session):
         """Test page retrieval with minimal v2 response."""
         # Mock the v2 API response without optional fields
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "123456",
-            "status": "current",
-            "title": "Minimal Page",
-        }
-        mock_session.get.return_value = mock_response
+        mock_session.get.return_value = _mk_response(_MINIMAL_PAGE_JSON)
 
         # Call the method
         result = v2_adapter.get_page("123456")
@@ -115,14 +120,9 @@ class TestConfluenceV2Adapter:
     def test_get_page_with_expand_parameter(self, v2_adapter, mock_session):
         """Test that expand parameter is accepted but not used."""
         # Mock the v2 API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "123456",
-            "status": "current",
-            "title": "Test Page",
-        }
-        mock_session.get.return_value = mock_response
+        mock_session.get.return_value = _mk_response(
+            {"id": "123456", "status": "current", "title": "Test Page"}
+        )
 
         # Call with expand parameter
         result = v2_adapter.get_page("123456", expand="body.storage,version")
@@ -6,33 +6,74 @@ It builds upon the root conftest.py fixtures and provides Jira-specific mocks,
 configurations, and utilities with efficient session-scoped caching.
 """
 
+import copy
 import os
-from unittest.mock import MagicMock, patch
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Any, NamedTuple
+from unittest.mock import MagicMock
 
 import pytest
+from atlassian import Jira
 
+from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.client import JiraClient
 from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.preprocessing import JiraPreprocessor
+from mcp_atlassian.utils.oauth import BYOAccessTokenOAuthConfig, OAuthConfig
 from tests.utils.factories import AuthConfigFactory, JiraIssueFactory
 from tests.utils.mocks import MockAtlassianClient
 
-# ============================================================================
-# Session-Scoped Jira Data Fixtures
-# ============================================================================
+# Environment variables required by jira_integration_client
+_JIRA_INTEGRATION_ENV_VARS = ("JIRA_URL", "JIRA_USERNAME", "JIRA_API_TOKEN")
 
 
-@pytest.fixture(scope="session")
-def session_jira_field_definitions():
-    """
-    Session-scoped fixture providing Jira field definitions.
+def pytest_configure(config):
+    """Stash the Jira reference data once for the whole test run."""
+    config.stash[JIRA_DATA_KEY] = JiraSessionData(
+        JIRA_FIELD_DEFINITIONS, JIRA_PROJECTS, JIRA_ISSUE_TYPES
+    )
 
-    This expensive-to-create data is cached for the entire test session
-    to improve test performance.
 
-    Returns:
-        List[Dict[str, Any]]: Complete Jira field definitions
-    """
-    return [
+def pytest_collection_modifyitems(config, items):
+    """Skip tests using jira_integration_client when credentials are missing."""
+    if all(os.environ.get(var) for var in _JIRA_INTEGRATION_ENV_VARS):
+        return
+
+    skip_integration = pytest.mark.skip(
+        reason="Integration test environment variables not set"
+    )
+    for item in items:
+        if "jira_integration_client" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip_integration)
+
+
+def _freeze(value):
+    """Recursively convert dicts/lists into read-only mappings/tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    """Return a mutable deep copy of data produced by ``_freeze``."""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# Attributes configured on the mock Jira client that the real class lacks
+_EXTRA_JIRA_MOCK_ATTRIBUTES = ("issue_types", "get_issue_worklog", "get_issue_comments")
+
+# Read-only Jira reference data. The session fixtures below return these
+# objects; conftest code uses them directly without a fixture lookup.
+# Tests that need to modify an entry should take a mutable copy with _thaw().
+JIRA_FIELD_DEFINITIONS = _freeze(
+    [
         {"id": "summary", "name": "Summary", "schema": {"type": "string"}},
         {"id": "description", "name": "Description", "schema": {"type": "string"}},
         {"id": "issuetype", "name": "Issue Type", "schema": {"type": "issuetype"}},
@@ -114,17 +155,10 @@ def session_jira_field_definitions():
             "schema": {"type": "timetracking"},
         },
     ]
+)
 
-
-@pytest.fixture(scope="session")
-def session_jira_projects():
-    """
-    Session-scoped fixture providing Jira project definitions.
-
-    Returns:
-        List[Dict[str, Any]]: Mock Jira project data
-    """
-    return [
+JIRA_PROJECTS = _freeze(
+    [
         {
             "id": "10000",
             "key": "TEST",
@@ -150,17 +184,10 @@ def session_jira_projects():
             "description": "Sample project with service desk",
         },
     ]
+)
 
-
-@pytest.fixture(scope="session")
-def session_jira_issue_types():
-    """
-    Session-scoped fixture providing Jira issue type definitions.
-
-    Returns:
-        List[Dict[str, Any]]: Mock Jira issue type data
-    """
-    return [
+JIRA_ISSUE_TYPES = _freeze(
+    [
         {"id": "1", "name": "Bug", "iconUrl": "bug.png", "subtask": False},
         {"id": "2", "name": "Task", "iconUrl": "task.png", "subtask": False},
         {"id": "3", "name": "Story", "iconUrl": "story.png", "subtask": False},
@@ -179,6 +206,159 @@ def session_jira_issue_types():
             "subtask": False,
         },
     ]
+)
+
+# JiraConfig keyword arguments used by jira_config_factory unless overridden
+_DEFAULT_JIRA_CONFIG = MappingProxyType(
+    {
+        "url": "https://test.atlassian.net",
+        "auth_type": "basic",
+        "username": "test_username",
+        "api_token": "test_token",
+    }
+)
+
+# Paging fields of make_jira_search_results responses unless overridden
+_DEFAULT_SEARCH_PAGING = MappingProxyType({"startAt": 0, "maxResults": 50})
+
+# Default payloads handed out by mock_atlassian_jira and the factory
+# fixtures, built once instead of on every test.
+_DEFAULT_ISSUE = _freeze(JiraIssueFactory.create())
+_DEFAULT_JQL_ISSUES = tuple(
+    _freeze(JiraIssueFactory.create(key)) for key in ("TEST-1", "TEST-2", "TEST-3")
+)
+_DEFAULT_JQL_RESPONSE = _freeze(
+    {
+        "issues": list(_DEFAULT_JQL_ISSUES),
+        "total": 3,
+        "startAt": 0,
+        "maxResults": 50,
+    }
+)
+_WORKLOG_TEMPLATE = _freeze(
+    {
+        "id": "10000",
+        "timeSpent": "3h",
+        "timeSpentSeconds": 10800,
+        "comment": "Test work",
+        "started": "2023-01-01T09:00:00.000+0000",
+        "author": {"displayName": "Test User"},
+    }
+)
+_WORKLOG_RESPONSE = _freeze({"worklogs": [_WORKLOG_TEMPLATE]})
+_COMMENTS_RESPONSE = _freeze(
+    {
+        "comments": [
+            {
+                "id": "10000",
+                "body": "Test comment",
+                "author": {"displayName": "Test User"},
+                "created": "2023-01-01T12:00:00.000+0000",
+            }
+        ]
+    }
+)
+
+# Default return values configured on the mock Jira client by
+# mock_atlassian_jira, keyed by method name
+_MOCK_RETURN_VALUES = MappingProxyType(
+    {
+        "get_all_fields": JIRA_FIELD_DEFINITIONS,
+        "projects": JIRA_PROJECTS,
+        "issue_types": JIRA_ISSUE_TYPES,
+        "myself": _freeze({"accountId": "test-account-id", "displayName": "Test User"}),
+        "get_issue": _DEFAULT_ISSUE,
+        "jql": _DEFAULT_JQL_RESPONSE,
+        "create_issue": _DEFAULT_ISSUE,
+        # Returns None like the real API
+        "update_issue": None,
+        "get_issue_worklog": _WORKLOG_RESPONSE,
+        "get_issue_comments": _COMMENTS_RESPONSE,
+    }
+)
+
+
+def _build_client(client_cls, config, jira):
+    """
+    Create a JiraClient (or subclass) around a mock Jira without running __init__.
+
+    Sets the attributes JiraClient.__init__ assigns for a basic-auth config,
+    skipping construction of a real Atlassian client and its HTTP session.
+    """
+    client = client_cls.__new__(client_cls)
+    client.config = config
+    client.jira = jira
+    client.preprocessor = JiraPreprocessor(base_url=config.url)
+    client._field_ids_cache = None
+    client._current_user_account_id = None
+    return client
+
+
+# ============================================================================
+# Session-Scoped Jira Data Fixtures
+# ============================================================================
+
+
+class JiraSessionData(NamedTuple):
+    """Read-only Jira reference data shared across the test session."""
+
+    fields: tuple[Any, ...]
+    projects: tuple[Any, ...]
+    issue_types: tuple[Any, ...]
+
+
+JIRA_DATA_KEY = pytest.StashKey[JiraSessionData]()
+
+
+@pytest.fixture(scope="session")
+def session_jira_data(request):
+    """
+    Session-scoped fixture bundling all Jira reference data.
+
+    Fixtures that need several of the data sets should depend on this one
+    instead of the individual fixtures below. Code with access to the pytest
+    config can read the same object from ``config.stash[JIRA_DATA_KEY]``.
+
+    Returns:
+        JiraSessionData: Read-only field, project and issue type definitions
+    """
+    return request.config.stash[JIRA_DATA_KEY]
+
+
+@pytest.fixture(scope="session")
+def session_jira_field_definitions(session_jira_data):
+    """
+    Session-scoped fixture providing Jira field definitions.
+
+    This expensive-to-create data is cached for the entire test session
+    to improve test performance.
+
+    Returns:
+        Tuple[Mapping[str, Any], ...]: Complete, read-only Jira field definitions
+    """
+    return session_jira_data.fields
+
+
+@pytest.fixture(scope="session")
+def session_jira_projects(session_jira_data):
+    """
+    Session-scoped fixture providing Jira project definitions.
+
+    Returns:
+        Tuple[Mapping[str, Any], ...]: Read-only mock Jira project data
+    """
+    return session_jira_data.projects
+
+
+@pytest.fixture(scope="session")
+def session_jira_issue_types(session_jira_data):
+    """
+    Session-scoped fixture providing Jira issue type definitions.
+
+    Returns:
+        Tuple[Mapping[str, Any], ...]: Read-only mock Jira issue type data
+    """
+    return session_jira_data.issue_types
 
 
 # ============================================================================
@@ -186,7 +366,7 @@ def session_jira_issue_types():
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def jira_config_factory():
     """
     Factory for creating JiraConfig instances with customizable options.
@@ -201,30 +381,94 @@ def jira_config_factory():
     """
 
     def _create_config(**overrides):
-        defaults = {
-            "url": "https://test.atlassian.net",
-            "auth_type": "basic",
-            "username": "test_username",
-            "api_token": "test_token",
-        }
-        config_data = {**defaults, **overrides}
-        return JiraConfig(**config_data)
+        return JiraConfig(**ChainMap(overrides, _DEFAULT_JIRA_CONFIG))
 
     return _create_config
 
 
+@pytest.fixture(scope="session")
+def session_jira_config(jira_config_factory):
+    """
+    Session-scoped default JiraConfig template.
+
+    Returns:
+        JiraConfig: Standard test configuration shared by the session
+    """
+    return jira_config_factory()
+
+
 @pytest.fixture
-def mock_config(jira_config_factory):
+def mock_config(session_jira_config):
     """
     Create a standard mock JiraConfig instance.
 
     This fixture provides a consistent JiraConfig for tests that don't
-    need custom configuration.
+    need custom configuration. Each test gets a shallow copy of the session
+    template, so attribute changes made by a test stay local to it.
 
     Returns:
         JiraConfig: Standard test configuration
     """
-    return jira_config_factory()
+    return copy.copy(session_jira_config)
+
+
+@pytest.fixture(scope="session")
+def oauth_config_template():
+    """
+    Session-scoped OAuthConfig with a cloud ID and unexpired tokens.
+
+    Returns:
+        OAuthConfig: Shared template; use ``oauth_config`` in tests
+    """
+    return OAuthConfig(
+        client_id="test-client-id",
+        client_secret="test-client-secret",
+        redirect_uri="https://example.com/callback",
+        scope="read:jira-work write:jira-work",
+        cloud_id="test-cloud-id",
+        access_token="test-access-token",
+        refresh_token="test-refresh-token",
+        expires_at=9999999999.0,  # Set a future expiry time
+    )
+
+
+@pytest.fixture
+def oauth_config(oauth_config_template):
+    """
+    Create a per-test copy of the standard OAuthConfig.
+
+    Use ``dataclasses.replace`` on the result for variants.
+
+    Returns:
+        OAuthConfig: Standard OAuth configuration
+    """
+    return copy.copy(oauth_config_template)
+
+
+@pytest.fixture(scope="session")
+def byo_oauth_config_template():
+    """
+    Session-scoped BYOAccessTokenOAuthConfig with a cloud ID and token.
+
+    Returns:
+        BYOAccessTokenOAuthConfig: Shared template; use ``byo_oauth_config``
+    """
+    return BYOAccessTokenOAuthConfig(
+        cloud_id="test-cloud-id", access_token="my-byo-token"
+    )
+
+
+@pytest.fixture
+def byo_oauth_config(byo_oauth_config_template):
+    """
+    Create a per-test copy of the standard BYO access token OAuth config.
+
+    Use ``dataclasses.replace`` on the result for variants.
+
+    Returns:
+        BYOAccessTokenOAuthConfig: Standard BYO OAuth configuration
+    """
+    return copy.copy(byo_oauth_config_template)
 
 
 # ============================================================================
@@ -232,43 +476,87 @@ def mock_config(jira_config_factory):
 # ============================================================================
 
 
+# Environment variables read by JiraConfig.from_env(): the JIRA_* and
+# ATLASSIAN_OAUTH_* prefixes, plus the generic proxy settings
+_JIRA_ENV_PREFIXES = ("JIRA_", "ATLASSIAN_OAUTH_")
+_PROXY_ENV_VARS = ("HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY", "SOCKS_PROXY")
+
+
+@pytest.fixture(scope="session")
+def session_jira_env_values():
+    """
+    Session-scoped fixture providing the basic-auth Jira environment.
+
+    Returns:
+        Mapping[str, str]: Read-only environment variable values
+    """
+    return MappingProxyType(
+        {
+            "JIRA_URL": "https://test.atlassian.net",
+            "JIRA_USERNAME": "test_username",
+            "JIRA_API_TOKEN": "test_token",
+        }
+    )
+
+
+@pytest.fixture
+def clean_jira_env(monkeypatch):
+    """
+    Clear the environment variables JiraConfig.from_env() reads.
+
+    Removes any Jira, OAuth and proxy settings inherited from the process
+    environment. monkeypatch restores only the variables it touched.
+    """
+    for name in list(os.environ):
+        if name.startswith(_JIRA_ENV_PREFIXES) or name in _PROXY_ENV_VARS:
+            monkeypatch.delenv(name, raising=False)
+
+
 @pytest.fixture
-def mock_env_vars():
+def mock_env_vars(clean_jira_env, monkeypatch, session_jira_env_values):
     """
     Mock environment variables for testing.
 
+    Starts from the clean environment of ``clean_jira_env``, then sets the
+    basic-auth values.
+
     Note: This fixture is maintained for backward compatibility.
     Consider using the environment fixtures from root conftest.py.
     """
-    with patch.dict(
-        os.environ,
+    for name, value in session_jira_env_values.items():
+        monkeypatch.setenv(name, value)
+
+
+@pytest.fixture(scope="session")
+def session_jira_auth_env_values():
+    """
+    Session-scoped fixture providing the factory-built Jira auth environment.
+
+    Returns:
+        Mapping[str, str]: Read-only environment variable values
+    """
+    auth_config = AuthConfigFactory.create_basic_auth_config()
+    return MappingProxyType(
         {
-            "JIRA_URL": "https://test.atlassian.net",
-            "JIRA_USERNAME": "test_username",
-            "JIRA_API_TOKEN": "test_token",
-        },
-        clear=True,  # Clear existing environment variables
-    ):
-        yield
+            "JIRA_URL": auth_config["url"],
+            "JIRA_USERNAME": auth_config["username"],
+            "JIRA_API_TOKEN": auth_config["api_token"],
+        }
+    )
 
 
 @pytest.fixture
-def jira_auth_environment():
+def jira_auth_environment(monkeypatch, session_jira_auth_env_values):
     """
     Fixture providing Jira-specific authentication environment.
 
     This sets up environment variables specifically for Jira authentication
     and can be customized per test.
     """
-    auth_config = AuthConfigFactory.create_basic_auth_config()
-    jira_env = {
-        "JIRA_URL": auth_config["url"],
-        "JIRA_USERNAME": auth_config["username"],
-        "JIRA_API_TOKEN": auth_config["api_token"],
-    }
-
-    with patch.dict(os.environ, jira_env, clear=False):
-        yield jira_env
+    jira_env = dict(session_jira_auth_env_values)
+    for name, value in jira_env.items():
+        monkeypatch.setenv(name, value)
+    return jira_env
 
 
 # ============================================================================
@@ -276,10 +564,27 @@ def jira_auth_environment():
 # ============================================================================
 
 
+@pytest.fixture(scope="session")
+def session_atlassian_jira():
+    """
+    Session-scoped mock of the Atlassian Jira client.
+
+    The mock is built once per session; ``mock_atlassian_jira`` resets it and
+    restores the default responses before each test.
+
+    The mock is specced on the attributes of a real Atlassian ``Jira``
+    instance plus the defaults configured by ``mock_atlassian_jira``, so
+    unknown attributes raise instead of spawning child mocks.
+
+    Returns:
+        MagicMock: Unconfigured mock Jira client
+    """
+    jira = Jira(url="https://test.atlassian.net")
+    return MagicMock(spec=[*dir(jira), *_EXTRA_JIRA_MOCK_ATTRIBUTES])
+
+
 @pytest.fixture
-def mock_atlassian_jira(
-    session_jira_field_definitions, session_jira_projects, session_jira_issue_types
-):
+def mock_atlassian_jira(session_atlassian_jira):
     """
     Enhanced mock of the Atlassian Jira client.
 
@@ -287,72 +592,72 @@ def mock_atlassian_jira(
     data for improved performance and consistency.
 
     Args:
-        session_jira_field_definitions: Session-scoped field definitions
-        session_jira_projects: Session-scoped project data
-        session_jira_issue_types: Session-scoped issue type data
+        session_atlassian_jira: Session-scoped mock Jira client
 
     Returns:
         MagicMock: Fully configured mock Jira client
     """
-    mock_jira = MagicMock()
+    mock_jira = session_atlassian_jira
+    # Drop call history, return values and side effects left by the previous
+    # test; child mocks that a test replaced are reset along with the rest
+    mock_jira.reset_mock(return_value=True, side_effect=True)
 
-    # Use session-scoped data for consistent responses
-    mock_jira.get_all_fields.return_value = session_jira_field_definitions
-    mock_jira.projects.return_value = session_jira_projects
-    mock_jira.issue_types.return_value = session_jira_issue_types
+    # The API returns plain lists of dicts, so hand out mutable copies of the
+    # frozen templates
+    for name, value in _MOCK_RETURN_VALUES.items():
+        getattr(mock_jira, name).return_value = _thaw(value)
 
-    # Set up common method returns using factory
-    mock_jira.myself.return_value = {
-        "accountId": "test-account-id",
-        "displayName": "Test User",
-    }
-    mock_jira.get_issue.return_value = JiraIssueFactory.create()
-
-    # Search results
-    mock_jira.jql.return_value = {
-        "issues": [
-            JiraIssueFactory.create("TEST-1"),
-            JiraIssueFactory.create("TEST-2"),
-            JiraIssueFactory.create("TEST-3"),
-        ],
-        "total": 3,
-        "startAt": 0,
-        "maxResults": 50,
-    }
+    yield mock_jira
 
-    # Issue creation
-    mock_jira.create_issue.return_value = JiraIssueFactory.create()
 
-    # Issue update (returns None like real API)
-    mock_jira.update_issue.return_value = None
+@pytest.fixture(scope="session")
+def session_jira_class():
+    """
+    Session-scoped stand-in for the Atlassian ``Jira`` class.
 
-    # Worklog operations
-    mock_jira.get_issue_worklog.return_value = {
-        "worklogs": [
-            {
-                "id": "10000",
-                "timeSpent": "3h",
-                "timeSpentSeconds": 10800,
-                "comment": "Test work",
-                "started": "2023-01-01T09:00:00.000+0000",
-                "author": {"displayName": "Test User"},
-            }
-        ]
-    }
+    Returns:
+        MagicMock: Mock class specced on ``atlassian.Jira``
+    """
+    return MagicMock(spec=Jira)
 
-    # Comments
-    mock_jira.get_issue_comments.return_value = {
-        "comments": [
-            {
-                "id": "10000",
-                "body": "Test comment",
-                "author": {"displayName": "Test User"},
-                "created": "2023-01-01T12:00:00.000+0000",
-            }
-        ]
-    }
 
-    yield mock_jira
+@pytest.fixture
+def mock_jira_class(session_jira_class, monkeypatch):
+    """
+    Replace the Jira class used by JiraClient with the session mock.
+
+    The mock is reset before each test, so call assertions only see the
+    constructor calls made by the current test.
+
+    Args:
+        session_jira_class: Session-scoped mock Jira class
+        monkeypatch: pytest monkeypatch fixture
+
+    Returns:
+        MagicMock: Mock Jira class patched into ``mcp_atlassian.jira.client``
+    """
+    session_jira_class.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr("mcp_atlassian.jira.client.Jira", session_jira_class)
+    return session_jira_class
+
+
+@pytest.fixture
+def mock_jira_instance(mock_jira_class):
+    """
+    Mock Jira client returned when JiraClient constructs ``Jira``.
+
+    Its ``_session.headers`` starts as an empty dict, so tests can inspect
+    the headers JiraClient applies.
+
+    Args:
+        mock_jira_class: Mock Jira class patched into the client module
+
+    Returns:
+        MagicMock: Mock Jira client instance
+    """
+    instance = mock_jira_class.return_value
+    instance._session.headers = {}
+    return instance
 
 
 @pytest.fixture
@@ -389,13 +694,7 @@ def jira_client(mock_config, mock_atlassian_jira):
     Returns:
         JiraClient: Configured client instance
     """
-    with patch("atlassian.Jira") as mock_jira_class:
-        mock_jira_class.return_value = mock_atlassian_jira
-
-        client = JiraClient(config=mock_config)
-        # Replace the actual Jira instance with our mock
-        client.jira = mock_atlassian_jira
-        yield client
+    return _build_client(JiraClient, mock_config, mock_atlassian_jira)
 
 
 @pytest.fixture
@@ -412,15 +711,7 @@ def jira_fetcher(mock_config, mock_atlassian_jira):
     Returns:
         JiraFetcher: Configured fetcher instance
     """
-    from mcp_atlassian.jira import JiraFetcher
-
-    with patch("atlassian.Jira") as mock_jira_class:
-        mock_jira_class.return_value = mock_atlassian_jira
-
-        fetcher = JiraFetcher(config=mock_config)
-        # Replace the actual Jira instance with our mock
-        fetcher.jira = mock_atlassian_jira
-        yield fetcher
+    return _build_client(JiraFetcher, mock_config, mock_atlassian_jira)
 
 
 # ============================================================================
@@ -452,18 +743,11 @@ def make_jira_issue_with_worklog():
         **overrides,
     ):
         issue = JiraIssueFactory.create(key, **overrides)
-        issue["fields"]["worklog"] = {
-            "worklogs": [
-                {
-                    "id": "10000",
-                    "timeSpent": f"{worklog_hours}h",
-                    "timeSpentSeconds": worklog_hours * 3600,
-                    "comment": worklog_comment,
-                    "started": "2023-01-01T09:00:00.000+0000",
-                    "author": {"displayName": "Test User"},
-                }
-            ]
-        }
+        worklog = _thaw(_WORKLOG_TEMPLATE)
+        worklog["timeSpent"] = f"{worklog_hours}h"
+        worklog["timeSpentSeconds"] = worklog_hours * 3600
+        worklog["comment"] = worklog_comment
+        issue["fields"]["worklog"] = {"worklogs": [worklog]}
         return issue
 
     return _create_issue_with_worklog
@@ -488,21 +772,18 @@ def make_jira_search_results():
     def _create_search_results(
         issues: list[str] = None, total: int = None, **overrides
     ):
+        if issues is None and total is None and not overrides:
+            return _thaw(_DEFAULT_JQL_RESPONSE)
+
         if issues is None:
-            issues = ["TEST-1", "TEST-2", "TEST-3"]
+            issue_objects = _thaw(_DEFAULT_JQL_ISSUES)
+        else:
+            issue_objects = [JiraIssueFactory.create(key) for key in issues]
         if total is None:
-            total = len(issues)
-
-        issue_objects = [JiraIssueFactory.create(key) for key in issues]
-
-        defaults = {
-            "issues": issue_objects,
-            "total": total,
-            "startAt": 0,
-            "maxResults": 50,
-        }
+            total = len(issue_objects)
 
-        return {**defaults, **overrides}
+        results = {"issues": issue_objects, "total": total}
+        return dict(ChainMap(overrides, results, _DEFAULT_SEARCH_PAGING))
 
     return _create_search_results
 
@@ -512,25 +793,22 @@ def make_jira_search_results():
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def jira_integration_client(session_auth_configs):
     """
     Create a JiraClient for integration testing.
 
     This fixture creates a client that can be used for integration tests
-    when real API credentials are available.
+    when real API credentials are available. Tests that use it are skipped
+    at collection time when the credentials are not set, so one client is
+    shared by the whole session.
 
     Args:
         session_auth_configs: Session-scoped auth configurations
 
     Returns:
-        Optional[JiraClient]: Real client if credentials available, None otherwise
+        JiraClient: Real client built from the environment credentials
     """
-    # Check if integration test environment variables are set
-    required_vars = ["JIRA_URL", "JIRA_USERNAME", "JIRA_API_TOKEN"]
-    if not all(os.environ.get(var) for var in required_vars):
-        pytest.skip("Integration test environment variables not set")
-
     config = JiraConfig(
         url=os.environ["JIRA_URL"],
         auth_type="basic",
@@ -1,7 +1,7 @@
 """Tests for the JiraClient with OAuth authentication."""
 
-import os
-from unittest.mock import MagicMock, PropertyMock, patch
+from dataclasses import replace
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -9,278 +9,135 @@ from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira.client import JiraClient
 from mcp_atlassian.jira.config import JiraConfig
 from mcp_atlassian.utils.oauth import BYOAccessTokenOAuthConfig, OAuthConfig
+from tests.utils.assertions import assert_oauth_client_initialized
 
 
-class TestJiraClientOAuth:
-    """Tests for JiraClient with OAuth authentication."""
-
-    def test_init_with_oauth_config(self):
-        """Test initializing the client with OAuth configuration."""
-        # Create a mock OAuth config with both access and refresh tokens
-        oauth_config = OAuthConfig(
-            client_id="test-client-id",
-            client_secret="test-client-secret",
-            redirect_uri="https://example.com/callback",
-            scope="read:jira-work write:jira-work",
-            cloud_id="test-cloud-id",
-            access_token="test-access-token",
-            refresh_token="test-refresh-token",
-            expires_at=9999999999.0,  # Set a future expiry time
-        )
-
-        # Create a Jira config with OAuth
-        config = JiraConfig(
-            url="https://test.atlassian.net",
-            auth_type="oauth",
-            oauth_config=oauth_config,
-        )
-
-        # Mock dependencies
-        with (
-            patch("mcp_atlassian.jira.client.Jira") as mock_jira,
-            patch(
-                "mcp_atlassian.jira.client.configure_oauth_session"
-            ) as mock_configure_oauth,
-            patch(
-                "mcp_atlassian.jira.client.configure_ssl_verification"
-            ) as mock_configure_ssl,
-            patch.object(
-                OAuthConfig,
-                "is_token_expired",
-                new_callable=PropertyMock,
-                return_value=False,
-            ) as mock_is_expired,
-            patch.object(
-                oauth_config, "ensure_valid_token", return_value=True
-            ) as mock_ensure_valid,
-        ):
-            # Configure the mock to return success for OAuth configuration
-            mock_configure_oauth.return_value = True
-
-            # Initialize client
-            client = JiraClient(config=config)
+def _oauth_jira_config(oauth_config):
+    """Create a Jira config using OAuth with the given OAuth configuration."""
+    return JiraConfig(
+        url="https://test.atlassian.net",
+        auth_type="oauth",
+        oauth_config=oauth_config,
+    )
 
-            # Verify OAuth session configuration was called
-            mock_configure_oauth.assert_called_once()
 
-            # Verify Jira was initialized with the expected parameters
-            mock_jira.assert_called_once()
-            jira_kwargs = mock_jira.call_args[1]
-            assert (
-                jira_kwargs["url"]
-                == f"https://api.atlassian.com/ex/jira/{oauth_config.cloud_id}"
-            )
-            assert "session" in jira_kwargs
-            assert jira_kwargs["cloud"] is True
-
-            # Verify SSL verification was configured
-            mock_configure_ssl.assert_called_once()
-
-    def test_init_with_oauth_missing_cloud_id(self):
-        """Test initializing the client with OAuth but missing cloud_id."""
-        # Create a mock OAuth config without cloud_id
-        oauth_config = OAuthConfig(
-            client_id="test-client-id",
-            client_secret="test-client-secret",
-            redirect_uri="https://example.com/callback",
-            scope="read:jira-work write:jira-work",
-            # No cloud_id
-            access_token="test-access-token",
-        )
+class TestJiraClientOAuth:
+    """Tests for JiraClient with OAuth authentication."""
 
-        # Create a Jira config with OAuth
-        config = JiraConfig(
-            url="https://test.atlassian.net",
-            auth_type="oauth",
-            oauth_config=oauth_config,
+    @pytest.mark.parametrize(
+        ("config_kind", "overrides", "session_ok", "expected_error", "match"),
+        [
+            pytest.param("oauth", {}, True, None, None, id="oauth"),
+            pytest.param("byo", {}, True, None, None, id="byo"),
+            pytest.param(
+                "oauth",
+                {},
+                False,
+                MCPAtlassianAuthenticationError,
+                "Failed to configure OAuth session",
+                id="oauth-failed-session",
+            ),
+            pytest.param(
+                "byo",
+                {},
+                False,
+                MCPAtlassianAuthenticationError,
+                "Failed to configure OAuth session",
+                id="byo-failed-session",
+            ),
+            pytest.param(
+                "oauth",
+                {"cloud_id": None},
+                True,
+                ValueError,
+                "OAuth authentication requires a valid cloud_id",
+                id="oauth-missing-cloud-id",
+            ),
+            pytest.param(
+                "byo",
+                {"cloud_id": ""},
+                True,
+                ValueError,
+                "OAuth authentication requires a valid cloud_id",
+                id="byo-missing-cloud-id",
+            ),
+        ],
+    )
+    def test_init_with_oauth(
+        self,
+        mock_jira_class,
+        monkeypatch,
+        oauth_config,
+        byo_oauth_config,
+        config_kind,
+        overrides,
+        session_ok,
+        expected_error,
+        match,
+    ):
+        """Test initializing the client with standard and BYO OAuth configs."""
+        base_config = oauth_config if config_kind == "oauth" else byo_oauth_config
+        auth_config = replace(base_config, **overrides)
+        config = _oauth_jira_config(auth_config)
+
+        # Mock dependencies; patch where the functions are imported, not where
+        # they're defined
+        mock_configure_oauth = MagicMock(return_value=session_ok)
+        mock_configure_ssl = MagicMock()
+        monkeypatch.setattr(
+            "mcp_atlassian.jira.client.configure_oauth_session", mock_configure_oauth
         )
-
-        # Verify error is raised
-        with pytest.raises(
-            ValueError, match="OAuth authentication requires a valid cloud_id"
-        ):
-            JiraClient(config=config)
-
-    def test_init_with_oauth_failed_session_config(self):
-        """Test initializing the client with OAuth but failed session configuration."""
-        # Create a mock OAuth config
-        oauth_config = OAuthConfig(
-            client_id="test-client-id",
-            client_secret="test-client-secret",
-            redirect_uri="https://example.com/callback",
-            scope="read:jira-work write:jira-work",
-            cloud_id="test-cloud-id",
-            access_token="test-access-token",
-            refresh_token="test-refresh-token",
+        monkeypatch.setattr(
+            "mcp_atlassian.jira.client.configure_ssl_verification", mock_configure_ssl
         )
-
-        # Create a Jira config with OAuth
-        config = JiraConfig(
-            url="https://test.atlassian.net",
-            auth_type="oauth",
-            oauth_config=oauth_config,
+        monkeypatch.setattr(
+            OAuthConfig, "is_token_expired", property(lambda self: False)
         )
 
-        # Mock dependencies with OAuth configuration failure
-        with (
-            patch("mcp_atlassian.jira.client.Jira") as mock_jira,
-            # Patch where the function is imported, not where it's defined
-            patch(
-                "mcp_atlassian.jira.client.configure_oauth_session"
-            ) as mock_configure_oauth,
-            patch(
-                "mcp_atlassian.jira.client.configure_ssl_verification"
-            ) as mock_configure_ssl,
-            patch(
-                "mcp_atlassian.preprocessing.jira.JiraPreprocessor"
-            ) as mock_preprocessor,
-            patch.object(
-                OAuthConfig,
-                "is_token_expired",
-                new_callable=PropertyMock,
-                return_value=False,
-            ) as mock_is_expired,
-            patch.object(
-                oauth_config, "ensure_valid_token", return_value=True
-            ) as mock_ensure_valid,
-        ):
-            # Configure the mock to return failure for OAuth configuration
-            mock_configure_oauth.return_value = False
-
-            # Verify error is raised
-            with pytest.raises(
-                MCPAtlassianAuthenticationError,
-                match="Failed to configure OAuth session",
-            ):
+        if expected_error is not None:
+            with pytest.raises(expected_error, match=match):
                 JiraClient(config=config)
+            return
 
-    def test_init_with_byo_access_token_oauth_config(self):
-        """Test initializing the client with BYO Access Token OAuth configuration."""
-        # Create a mock BYO OAuth config
-        byo_oauth_config = BYOAccessTokenOAuthConfig(
-            cloud_id="test-cloud-id", access_token="my-byo-token"
-        )
+        # Initialize client
+        JiraClient(config=config)
 
-        # Create a Jira config with OAuth
-        config = JiraConfig(
-            url="https://test.atlassian.net",
-            auth_type="oauth",
-            oauth_config=byo_oauth_config,
+        assert_oauth_client_initialized(
+            mock_jira_class,
+            mock_configure_oauth,
+            mock_configure_ssl,
+            auth_config.cloud_id,
         )
 
-        # Mock dependencies
-        with (
-            patch("mcp_atlassian.jira.client.Jira") as mock_jira,
-            patch(
-                "mcp_atlassian.jira.client.configure_oauth_session"
-            ) as mock_configure_oauth,
-            patch(
-                "mcp_atlassian.jira.client.configure_ssl_verification"
-            ) as mock_configure_ssl,
-        ):
-            # Configure the mock to return success for OAuth configuration
-            mock_configure_oauth.return_value = True
-
-            # Initialize client
-            client = JiraClient(config=config)
-
-            # Verify OAuth session configuration was called
-            mock_configure_oauth.assert_called_once()
-
-            # Verify Jira was initialized with the expected parameters
-            mock_jira.assert_called_once()
-            jira_kwargs = mock_jira.call_args[1]
-            assert (
-                jira_kwargs["url"]
-                == f"https://api.atlassian.com/ex/jira/{byo_oauth_config.cloud_id}"
-            )
-            assert "session" in jira_kwargs
-            assert jira_kwargs["cloud"] is True
-
-            # Verify SSL verification was configured
-            mock_configure_ssl.assert_called_once()
+    def test_init_with_byo_oauth_empty_token_failed_session_config(
+        self, mock_jira_class, monkeypatch, byo_oauth_config
+    ):
+        """Test init with BYO OAuth, empty token, so session config fails."""
+        config = _oauth_jira_config(replace(byo_oauth_config, access_token=""))
 
-    def test_init_with_byo_oauth_missing_cloud_id(self):
-        """Test initializing with BYO OAuth but missing cloud_id."""
-        # Create a mock BYO OAuth config with an empty cloud_id
-        byo_oauth_config = BYOAccessTokenOAuthConfig(
-            cloud_id="", access_token="my-byo-token"
+        # Mock dependencies; configure_oauth_session rejects an empty BYO token
+        # (covered in tests/unit/utils/test_oauth.py), so stub that outcome
+        mock_configure_oauth = MagicMock(return_value=False)
+        monkeypatch.setattr(
+            "mcp_atlassian.jira.client.configure_oauth_session", mock_configure_oauth
         )
-
-        # Create a Jira config with OAuth
-        config = JiraConfig(
-            url="https://test.atlassian.net",
-            auth_type="oauth",
-            oauth_config=byo_oauth_config,
+        monkeypatch.setattr(
+            "mcp_atlassian.jira.client.configure_ssl_verification", MagicMock()
         )
 
         # Verify error is raised
         with pytest.raises(
-            ValueError, match="OAuth authentication requires a valid cloud_id"
+            MCPAtlassianAuthenticationError,
+            match="Failed to configure OAuth session",
         ):
             JiraClient(config=config)
 
-    def test_init_with_byo_oauth_failed_session_config(self):
-        """Test init with BYO OAuth but failed session configuration."""
-        # Create a mock BYO OAuth config
-        byo_oauth_config = BYOAccessTokenOAuthConfig(
-            cloud_id="test-cloud-id", access_token="my_byo_token"
-        )
-
-        # Create a Jira config with OAuth
-        config = JiraConfig(
-            url="https://test.atlassian.net",
-            auth_type="oauth",
-            oauth_config=byo_oauth_config,
-        )
-
-        # Mock dependencies with OAuth configuration failure
-        with (
-            patch("mcp_atlassian.jira.client.Jira"),  # No need to assert mock_jira
-            patch(
-                "mcp_atlassian.jira.client.configure_oauth_session"
-            ) as mock_configure_oauth,
-            patch("mcp_atlassian.jira.client.configure_ssl_verification"),
-        ):
-            # Configure the mock to return failure for OAuth configuration
-            mock_configure_oauth.return_value = False
-
-            # Verify error is raised
-            with pytest.raises(
-                MCPAtlassianAuthenticationError,
-                match="Failed to configure OAuth session",
-            ):
-                JiraClient(config=config)
-
-    def test_init_with_byo_oauth_empty_token_failed_session_config(self):
-        """Test init with BYO OAuth, empty token, so session config fails."""
-        # Create a mock BYO OAuth config with an empty token
-        byo_oauth_config_empty_token = BYOAccessTokenOAuthConfig(
-            cloud_id="test-cloud-id",
-            access_token="",  # Empty token
-        )
-
-        # Create a Jira config with OAuth
-        config = JiraConfig(
-            url="https://test.atlassian.net",
-            auth_type="oauth",
-            oauth_config=byo_oauth_config_empty_token,
-        )
-
-        # Mock dependencies - configure_oauth_session will be called with real logic
-        with (
-            patch("mcp_atlassian.jira.client.Jira"),
-            patch("mcp_atlassian.jira.client.configure_ssl_verification"),
-            # We want to test the actual behavior of configure_oauth_session here for empty token
-        ):
-            # Verify error is raised
-            with pytest.raises(
-                MCPAtlassianAuthenticationError,
-                match="Failed to configure OAuth session",
-            ):
-                JiraClient(config=config)
+        # Verify the session was configured with the empty token
+        mock_configure_oauth.assert_called_once()
+        _, passed_oauth_config = mock_configure_oauth.call_args.args
+        assert passed_oauth_config.access_token == ""
 
-    def test_from_env_with_oauth(self):
+    def test_from_env_with_oauth(self, mock_jira_class, monkeypatch):
         # Mock environment variables
         env_vars = {
             "JIRA_URL": "https://test.atlassian.net",
@@ -291,6 +148,8 @@ class TestJiraClientOAuth:
             "ATLASSIAN_OAUTH_SCOPE": "read:jira-work",
             "ATLASSIAN_OAUTH_CLOUD_ID": "env-cloud-id",
         }
+        for name, value in env_vars.items():
+            monkeypatch.setenv(name, value)
 
         # Mock OAuth config and token loading
         mock_oauth_config = MagicMock()
@@ -298,51 +157,39 @@ class TestJiraClientOAuth:
         mock_oauth_config.access_token = "env-access-token"
         mock_oauth_config.refresh_token = "env-refresh-token"
         mock_oauth_config.expires_at = 9999999999.0
+        mock_oauth_config.ensure_valid_token.return_value = True
 
-        with (
-            patch.dict(os.environ, env_vars),
-            patch(
-                "mcp_atlassian.jira.config.get_oauth_config_from_env",
-                return_value=mock_oauth_config,
-            ),
-            patch.object(
-                OAuthConfig,
-                "is_token_expired",
-                new_callable=PropertyMock,
-                return_value=False,
-            ) as mock_is_expired_env,
-            patch.object(
-                mock_oauth_config, "ensure_valid_token", return_value=True
-            ) as mock_ensure_valid_env,
-            patch("mcp_atlassian.jira.client.Jira") as mock_jira,
-            patch(
-                "mcp_atlassian.jira.client.configure_oauth_session", return_value=True
-            ) as mock_configure_oauth,
-            patch(
-                "mcp_atlassian.jira.client.configure_ssl_verification"
-            ) as mock_configure_ssl,
-        ):
-            # Initialize client from environment
-            client = JiraClient()
+        mock_configure_oauth = MagicMock(return_value=True)
+        mock_configure_ssl = MagicMock()
+        monkeypatch.setattr(
+            "mcp_atlassian.jira.config.get_oauth_config_from_env",
+            MagicMock(return_value=mock_oauth_config),
+        )
+        monkeypatch.setattr(
+            OAuthConfig, "is_token_expired", property(lambda self: False)
+        )
+        monkeypatch.setattr(
+            "mcp_atlassian.jira.client.configure_oauth_session", mock_configure_oauth
+        )
+        monkeypatch.setattr(
+            "mcp_atlassian.jira.client.configure_ssl_verification", mock_configure_ssl
+        )
 
-            # Verify client was initialized with OAuth
-            assert client.config.auth_type == "oauth"
-            assert client.config.oauth_config is mock_oauth_config
+        # Initialize client from environment
+        client = JiraClient()
 
-            # Verify Jira was initialized correctly
-            mock_jira.assert_called_once()
-            jira_kwargs = mock_jira.call_args[1]
-            assert (
-                jira_kwargs["url"]
-                == f"https://api.atlassian.com/ex/jira/{mock_oauth_config.cloud_id}"
-            )
-            assert "session" in jira_kwargs
-            assert jira_kwargs["cloud"] is True
+        # Verify client was initialized with OAuth
+        assert client.config.auth_type == "oauth"
+        assert client.config.oauth_config is mock_oauth_config
 
-            # Verify OAuth session was configured
-            mock_configure_oauth.assert_called_once()
+        assert_oauth_client_initialized(
+            mock_jira_class,
+            mock_configure_oauth,
+            mock_configure_ssl,
+            mock_oauth_config.cloud_id,
+        )
 
-    def test_from_env_with_byo_token_oauth(self):
+    def test_from_env_with_byo_token_oauth(self, mock_jira_class, monkeypatch):
         """Test JiraClient.from_env() when BYO token OAuth config is found."""
         env_vars = {
             "JIRA_URL": "https://test.atlassian.net",
@@ -353,6 +200,8 @@ class TestJiraClientOAuth:
             "ATLASSIAN_OAUTH_CLIENT_ID": "",
             "ATLASSIAN_OAUTH_CLIENT_SECRET": "",
         }
+        for name, value in env_vars.items():
+            monkeypatch.setenv(name, value)
 
         # Mock BYO OAuth config
         mock_byo_oauth_config = MagicMock(spec=BYOAccessTokenOAuthConfig)
@@ -361,37 +210,32 @@ class TestJiraClientOAuth:
         # BYO config does not have refresh_token or expires_at in the same way
         # and does not have is_token_expired or ensure_valid_token methods
 
-        with (
-            patch.dict(os.environ, env_vars),
-            patch(
-                "mcp_atlassian.jira.config.get_oauth_config_from_env",
-                return_value=mock_byo_oauth_config,
-            ),
-            patch("mcp_atlassian.jira.client.Jira") as mock_jira,
-            patch(
-                "mcp_atlassian.jira.client.configure_oauth_session", return_value=True
-            ) as mock_configure_oauth,
-            patch(
-                "mcp_atlassian.jira.client.configure_ssl_verification"
-            ) as mock_configure_ssl,
-        ):
-            client = JiraClient()  # Initializes from env via JiraConfig.from_env()
+        mock_configure_oauth = MagicMock(return_value=True)
+        mock_configure_ssl = MagicMock()
+        monkeypatch.setattr(
+            "mcp_atlassian.jira.config.get_oauth_config_from_env",
+            MagicMock(return_value=mock_byo_oauth_config),
+        )
+        monkeypatch.setattr(
+            "mcp_atlassian.jira.client.configure_oauth_session", mock_configure_oauth
+        )
+        monkeypatch.setattr(
+            "mcp_atlassian.jira.client.configure_ssl_verification", mock_configure_ssl
+        )
 
-            assert client.config.auth_type == "oauth"
-            assert client.config.oauth_config is mock_byo_oauth_config
+        client = JiraClient()  # Initializes from env via JiraConfig.from_env()
 
-            # Verify OAuth session configuration was called
-            mock_configure_oauth.assert_called_once()
+        assert client.config.auth_type == "oauth"
+        assert client.config.oauth_config is mock_byo_oauth_config
 
-            mock_jira.assert_called_once()
-            jira_kwargs = mock_jira.call_args[1]
-            assert (
-                jira_kwargs["url"]
-                == f"https://api.atlassian.com/ex/jira/{mock_byo_oauth_config.cloud_id}"
-            )
-            mock_configure_ssl.assert_called_once()
+        assert_oauth_client_initialized(
+            mock_jira_class,
+            mock_configure_oauth,
+            mock_configure_ssl,
+            mock_byo_oauth_config.cloud_id,
+        )
 
-    def test_from_env_with_no_oauth_config_found(self):
+    def test_from_env_with_no_oauth_config_found(self, clean_jira_env, monkeypatch):
         """Test JiraClient.from_env() when no OAuth config is found."""
         env_vars = {
             "JIRA_URL": "https://test.atlassian.net",
@@ -403,16 +247,16 @@ class TestJiraClientOAuth:
             "JIRA_USERNAME": "",
             "JIRA_API_TOKEN": "",
         }
+        for name, value in env_vars.items():
+            monkeypatch.setenv(name, value)
 
-        with (
-            patch.dict(os.environ, env_vars, clear=True),
-            patch(
-                "mcp_atlassian.jira.config.get_oauth_config_from_env",
-                return_value=None,  # Simulate no config found
-            ),
+        monkeypatch.setattr(
+            "mcp_atlassian.jira.config.get_oauth_config_from_env",
+            MagicMock(return_value=None),  # Simulate no config found
+        )
+
+        with pytest.raises(
+            ValueError,  # Adjusted to actual error raised by JiraConfig.from_env
+            match=r"Cloud authentication requires JIRA_USERNAME and JIRA_API_TOKEN, or OAuth configuration.*",
         ):
-            with pytest.raises(
-                ValueError,  # Adjusted to actual error raised by JiraConfig.from_env
-                match=r"Cloud authentication requires JIRA_USERNAME and JIRA_API_TOKEN, or OAuth configuration.*",
-            ):
-                JiraClient()
+            JiraClient()
@@ -3,8 +3,26 @@
 Focused tests for Jira constants, validating correct values and business logic.
 """
 
+import pytest
+
 from mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS
 
+_EXPECTED_FIELDS = frozenset(
+    {
+        "summary",
+        "description",
+        "status",
+        "assignee",
+        "reporter",
+        "labels",
+        "priority",
+        "created",
+        "updated",
+        "issuetype",
+    }
+)
+_ESSENTIAL_FIELDS = frozenset({"summary", "status", "issuetype"})
+
 
 class TestDefaultReadJiraFields:
     """Test suite for DEFAULT_READ_JIRA_FIELDS constant."""
@@ -17,30 +35,17 @@ class TestDefaultReadJiraFields:
 
     def test_contains_expected_jira_fields(self):
         """Test that DEFAULT_READ_JIRA_FIELDS contains the correct Jira fields."""
-        expected_fields = {
-            "summary",
-            "description",
-            "status",
-            "assignee",
-            "reporter",
-            "labels",
-            "priority",
-            "created",
-            "updated",
-            "issuetype",
-        }
-        assert DEFAULT_READ_JIRA_FIELDS == expected_fields
+        assert DEFAULT_READ_JIRA_FIELDS == _EXPECTED_FIELDS
 
     def test_essential_fields_present(self):
         """Test that essential Jira fields are included."""
-        essential_fields = {"summary", "status", "issuetype"}
-        assert essential_fields.issubset(DEFAULT_READ_JIRA_FIELDS)
+        assert _ESSENTIAL_FIELDS.issubset(DEFAULT_READ_JIRA_FIELDS)
 
-    def test_field_format_validity(self):
+    @pytest.mark.parametrize("field", sorted(DEFAULT_READ_JIRA_FIELDS))
+    def test_field_format_validity(self, field):
         """Test that field names are valid for API usage."""
-        for field in DEFAULT_READ_JIRA_FIELDS:
-            # Fields should be non-empty, lowercase, no spaces
-            assert field and field.islower()
-            assert " " not in field
-            assert not field.startswith("_")
-            assert not field.endswith("_")
+        # Fields should be non-empty, lowercase, no spaces
+        assert field and field.islower()
+        assert " " not in field
+        assert not field.startswith("_")
+        assert not field.endswith("_")
@@ -1,8 +1,5 @@
 """Tests for JIRA custom headers functionality."""
 
-import os
-from unittest.mock import MagicMock, patch
-
 from mcp_atlassian.jira.client import JiraClient
 from mcp_atlassian.jira.config import JiraConfig
 
@@ -10,82 +7,43 @@ from mcp_atlassian.jira.config import JiraConfig
 class TestJiraConfigCustomHeaders:
     """Test JiraConfig parsing of custom headers."""
 
-    def test_no_custom_headers(self):
+    def test_no_custom_headers(self, mock_env_vars):
         """Test JiraConfig when no custom headers are configured."""
-        with patch.dict(
-            os.environ,
-            {
-                "JIRA_URL": "https://test.atlassian.net",
-                "JIRA_USERNAME": "test_user",
-                "JIRA_API_TOKEN": "test_token",
-            },
-            clear=True,
-        ):
-            config = JiraConfig.from_env()
-            assert config.custom_headers == {}
-
-    def test_service_specific_headers_only(self):
+        config = JiraConfig.from_env()
+        assert config.custom_headers == {}
+
+    def test_service_specific_headers_only(self, mock_env_vars, monkeypatch):
         """Test JiraConfig parsing of service-specific headers only."""
-        with patch.dict(
-            os.environ,
-            {
-                "JIRA_URL": "https://test.atlassian.net",
-                "JIRA_USERNAME": "test_user",
-                "JIRA_API_TOKEN": "test_token",
-                "JIRA_CUSTOM_HEADERS": "X-Jira-Specific=jira_value,X-Service=service_value",
-            },
-            clear=True,
-        ):
-            config = JiraConfig.from_env()
-            expected = {"X-Jira-Specific": "jira_value", "X-Service": "service_value"}
-            assert config.custom_headers == expected
-
-    def test_malformed_headers_are_ignored(self):
+        monkeypatch.setenv(
+            "JIRA_CUSTOM_HEADERS", "X-Jira-Specific=jira_value,X-Service=service_value"
+        )
+        config = JiraConfig.from_env()
+        expected = {"X-Jira-Specific": "jira_value", "X-Service": "service_value"}
+        assert config.custom_headers == expected
+
+    def test_malformed_headers_are_ignored(self, mock_env_vars, monkeypatch):
         """Test that malformed headers are ignored gracefully."""
-        with patch.dict(
-            os.environ,
-            {
-                "JIRA_URL": "https://test.atlassian.net",
-                "JIRA_USERNAME": "test_user",
-                "JIRA_API_TOKEN": "test_token",
-                "JIRA_CUSTOM_HEADERS": "malformed-header,X-Valid=valid_value,another-malformed",
-            },
-            clear=True,
-        ):
-            config = JiraConfig.from_env()
-            expected = {"X-Valid": "valid_value"}
-            assert config.custom_headers == expected
-
-    def test_empty_header_strings(self):
+        monkeypatch.setenv(
+            "JIRA_CUSTOM_HEADERS",
+            "malformed-header,X-Valid=valid_value,another-malformed",
+        )
+        config = JiraConfig.from_env()
+        expected = {"X-Valid": "valid_value"}
+        assert config.custom_headers == expected
+
+    def test_empty_header_strings(self, mock_env_vars, monkeypatch):
         """Test handling of empty header strings."""
-        with patch.dict(
-            os.environ,
-            {
-                "JIRA_URL": "https://test.atlassian.net",
-                "JIRA_USERNAME": "test_user",
-                "JIRA_API_TOKEN": "test_token",
-                "JIRA_CUSTOM_HEADERS": "   ",
-            },
-            clear=True,
-        ):
-            config = JiraConfig.from_env()
-            assert config.custom_headers == {}
+        monkeypatch.setenv("JIRA_CUSTOM_HEADERS", "   ")
+        config = JiraConfig.from_env()
+        assert config.custom_headers == {}
 
 
 class TestJiraClientCustomHeaders:
     """Test JiraClient custom headers application."""
 
-    def test_no_custom_headers_applied(self, monkeypatch):
+    def test_no_custom_headers_applied(self, mock_jira_instance, monkeypatch):
         """Test that no headers are applied when none are configured."""
-        # Mock Jira and related dependencies
-        mock_jira = MagicMock()
-        mock_session = MagicMock()
-        mock_session.headers = {}
-        mock_jira._session = mock_session
-
-        monkeypatch.setattr(
-            "mcp_atlassian.jira.client.Jira", lambda **kwargs: mock_jira
-        )
+        # Mock related dependencies
         monkeypatch.setattr(
             "mcp_atlassian.jira.client.configure_ssl_verification",
             lambda **kwargs: None,
@@ -102,19 +60,11 @@ class TestJiraClientCustomHeaders:
         client = JiraClient(config=config)
 
         # Verify no custom headers were applied
-        assert mock_session.headers == {}
+        assert mock_jira_instance._session.headers == {}
 
-    def test_custom_headers_applied_to_session(self, monkeypatch):
+    def test_custom_headers_applied_to_session(self, mock_jira_instance, monkeypatch):
         """Test that custom headers are applied to the JIRA session."""
-        # Mock Jira and related dependencies
-        mock_jira = MagicMock()
-        mock_session = MagicMock()
-        mock_session.headers = {}
-        mock_jira._session = mock_session
-
-        monkeypatch.setattr(
-            "mcp_atlassian.jira.client.Jira", lambda **kwargs: mock_jira
-        )
+        # Mock related dependencies
         monkeypatch.setattr(
             "mcp_atlassian.jira.client.configure_ssl_verification",
             lambda **kwargs: None,
@@ -138,4 +88,4 @@ class TestJiraClientCustomHeaders:
 
         # Verify custom headers were applied to session
         for header_name, header_value in custom_headers.items():
-            assert mock_session.headers[header_name] == header_value
+            assert mock_jira_instance._session.headers[header_name] == header_value
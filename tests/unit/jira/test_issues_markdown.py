@@ -1,6 +1,6 @@
 """Tests for markdown conversion in Jira issue operations."""
 
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 
 import pytest
 
@@ -8,6 +8,19 @@ from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.issues import IssuesMixin
 
 
+def _fake_md_to_jira(text):
+    """Stand in for the markdown converter, tagging the converted text."""
+    return f"[CONVERTED] {text}" if text else ""
+
+
+# Fields create_issue sends for the project, summary and type used below
+_CREATE_FIELDS = {
+    "project": {"key": "TEST"},
+    "summary": "Test Issue",
+    "issuetype": {"name": "Bug"},
+}
+
+
 class TestIssuesMarkdownConversion:
     """Tests for markdown to Jira conversion in issue operations."""
 
@@ -17,206 +30,132 @@ class TestIssuesMarkdownConversion:
         mixin = jira_fetcher
 
         # Mock the markdown conversion method
-        mixin._markdown_to_jira = Mock(side_effect=lambda x: f"[CONVERTED] {x}")
+        mixin._markdown_to_jira = Mock(side_effect=_fake_md_to_jira)
 
         # Add other mock methods
-        mixin._get_account_id = MagicMock(return_value="test-account-id")
+        mixin._get_account_id = Mock(return_value="test-account-id")
 
         return mixin
 
-    def test_create_issue_converts_markdown_description(
-        self, issues_mixin: IssuesMixin
+    @pytest.mark.parametrize(
+        ("description_kwargs", "expected_fields"),
+        [
+            pytest.param(
+                {"description": "# Markdown Description\n\nThis is **bold** text."},
+                {
+                    **_CREATE_FIELDS,
+                    "description": (
+                        "[CONVERTED] # Markdown Description\n\nThis is **bold** text."
+                    ),
+                },
+                id="markdown-description",
+            ),
+            pytest.param(
+                {"description": ""},
+                _CREATE_FIELDS,
+                id="empty-description",
+            ),
+            # description not provided (defaults to "")
+            pytest.param(
+                {},
+                _CREATE_FIELDS,
+                id="no-description",
+            ),
+        ],
+    )
+    def test_create_issue_markdown(
+        self, issues_mixin: IssuesMixin, description_kwargs, expected_fields
     ):
-        """Test that create_issue converts markdown description to Jira format."""
-        # Mock create_issue response
-        create_response = {"key": "TEST-123"}
-        issues_mixin.jira.create_issue.return_value = create_response
-
-        # Mock get_issue response
-        issue_data = {
-            "id": "12345",
-            "key": "TEST-123",
-            "fields": {
-                "summary": "Test Issue",
-                "description": "[CONVERTED] # Markdown Description",
-                "status": {"name": "Open"},
-                "issuetype": {"name": "Bug"},
-            },
-        }
-        issues_mixin.jira.get_issue.return_value = issue_data
+        """Test that create_issue converts only non-empty markdown descriptions."""
+        issues_mixin.jira.create_issue.return_value = {"key": "TEST-123"}
+        issues_mixin.jira.get_issue.return_value = {"key": "TEST-123", "fields": {}}
 
-        # Create issue with markdown description
-        markdown_description = "# Markdown Description\n\nThis is **bold** text."
         issue = issues_mixin.create_issue(
             project_key="TEST",
             summary="Test Issue",
             issue_type="Bug",
-            description=markdown_description,
+            **description_kwargs,
         )
 
-        # Verify markdown conversion was called
-        issues_mixin._markdown_to_jira.assert_called_once_with(markdown_description)
+        # Verify markdown conversion was called only for a non-empty description
+        description = description_kwargs.get("description")
+        if description:
+            issues_mixin._markdown_to_jira.assert_called_once_with(description)
+        else:
+            issues_mixin._markdown_to_jira.assert_not_called()
 
-        # Verify the converted description was passed to API
-        expected_fields = {
-            "project": {"key": "TEST"},
-            "summary": "Test Issue",
-            "issuetype": {"name": "Bug"},
-            "description": f"[CONVERTED] {markdown_description}",
-        }
+        # Verify the (converted) fields were passed to API
         issues_mixin.jira.create_issue.assert_called_once_with(fields=expected_fields)
 
         # Verify result
         assert issue.key == "TEST-123"
 
-    def test_create_issue_with_empty_description(self, issues_mixin: IssuesMixin):
-        """Test that create_issue handles empty description correctly."""
-        # Mock create_issue response
-        create_response = {"key": "TEST-123"}
-        issues_mixin.jira.create_issue.return_value = create_response
-
-        # Mock get_issue response
-        issue_data = {
-            "id": "12345",
-            "key": "TEST-123",
-            "fields": {
-                "summary": "Test Issue",
-                "status": {"name": "Open"},
-                "issuetype": {"name": "Bug"},
-            },
-        }
-        issues_mixin.jira.get_issue.return_value = issue_data
-
-        # Create issue without description
-        issue = issues_mixin.create_issue(
-            project_key="TEST",
-            summary="Test Issue",
-            issue_type="Bug",
-            description="",
-        )
-
-        # Verify markdown conversion was not called (empty string)
-        issues_mixin._markdown_to_jira.assert_not_called()
-
-        # Verify no description field was added
-        call_args = issues_mixin.jira.create_issue.call_args[1]
-        assert "description" not in call_args["fields"]
-
-        # Verify result
-        assert issue.key == "TEST-123"
-
-    def test_update_issue_converts_markdown_in_fields(self, issues_mixin: IssuesMixin):
-        """Test that update_issue converts markdown description when passed in fields dict."""
-        # Mock the issue data for get_issue
-        issue_data = {
-            "id": "12345",
-            "key": "TEST-123",
-            "fields": {
-                "summary": "Updated Issue",
-                "description": "[CONVERTED] # Updated Description",
-                "status": {"name": "In Progress"},
-                "issuetype": {"name": "Bug"},
-            },
-        }
-        issues_mixin.jira.get_issue.return_value = issue_data
-
-        # Update issue with markdown description in fields
-        markdown_description = "# Updated Description\n\nThis is *italic* text."
-        issue = issues_mixin.update_issue(
-            issue_key="TEST-123",
-            fields={"description": markdown_description, "summary": "Updated Issue"},
-        )
-
-        # Verify markdown conversion was called
-        issues_mixin._markdown_to_jira.assert_called_once_with(markdown_description)
-
-        # Verify the converted description was passed to API
-        issues_mixin.jira.update_issue.assert_called_once_with(
-            issue_key="TEST-123",
-            update={
-                "fields": {
-                    "description": f"[CONVERTED] {markdown_description}",
+    @pytest.mark.parametrize(
+        ("fields", "description_kwargs", "markdown_description", "expected_fields"),
+        [
+            pytest.param(
+                {
+                    "description": "# Updated Description\n\nThis is *italic* text.",
                     "summary": "Updated Issue",
-                }
-            },
-        )
-
-        # Verify result
-        assert issue.key == "TEST-123"
-
-    def test_update_issue_converts_markdown_in_kwargs(self, issues_mixin: IssuesMixin):
-        """Test that update_issue converts markdown description when passed as kwarg."""
-        # Mock the issue data for get_issue
-        issue_data = {
-            "id": "12345",
-            "key": "TEST-123",
-            "fields": {
-                "summary": "Test Issue",
-                "description": "[CONVERTED] ## Updated via kwargs",
-                "status": {"name": "In Progress"},
-                "issuetype": {"name": "Bug"},
-            },
-        }
-        issues_mixin.jira.get_issue.return_value = issue_data
-
-        # Update issue with markdown description as kwarg
-        markdown_description = (
-            "## Updated via kwargs\n\nWith a [link](http://example.com)"
-        )
-        issue = issues_mixin.update_issue(
-            issue_key="TEST-123", description=markdown_description
-        )
-
-        # Verify markdown conversion was called
-        issues_mixin._markdown_to_jira.assert_called_once_with(markdown_description)
-
-        # Verify the converted description was passed to API
-        issues_mixin.jira.update_issue.assert_called_once_with(
-            issue_key="TEST-123",
-            update={"fields": {"description": f"[CONVERTED] {markdown_description}"}},
-        )
-
-        # Verify result
-        assert issue.key == "TEST-123"
-
-    def test_update_issue_with_multiple_fields_including_description(
-        self, issues_mixin: IssuesMixin
+                },
+                {},
+                "# Updated Description\n\nThis is *italic* text.",
+                {
+                    "description": (
+                        "[CONVERTED] # Updated Description\n\nThis is *italic* text."
+                    ),
+                    "summary": "Updated Issue",
+                },
+                id="description-in-fields",
+            ),
+            pytest.param(
+                None,
+                {
+                    "description": (
+                        "## Updated via kwargs\n\nWith a [link](http://example.com)"
+                    )
+                },
+                "## Updated via kwargs\n\nWith a [link](http://example.com)",
+                {
+                    "description": (
+                        "[CONVERTED] ## Updated via kwargs\n\n"
+                        "With a [link](http://example.com)"
+                    )
+                },
+                id="description-in-kwargs",
+            ),
+            pytest.param(
+                {"summary": "Updated Summary", "priority": {"name": "High"}},
+                {"description": "Updated description with **emphasis**"},
+                "Updated description with **emphasis**",
+                {
+                    "summary": "Updated Summary",
+                    "priority": {"name": "High"},
+                    "description": "[CONVERTED] Updated description with **emphasis**",
+                },
+                id="multiple-fields-with-description-kwarg",
+            ),
+        ],
+    )
+    def test_update_issue_markdown(
+        self,
+        issues_mixin: IssuesMixin,
+        fields,
+        description_kwargs,
+        markdown_description,
+        expected_fields,
     ):
-        """Test update_issue with multiple fields including description."""
-        # Mock the issue data for get_issue
-        issue_data = {
-            "id": "12345",
-            "key": "TEST-123",
-            "fields": {
-                "summary": "Updated Summary",
-                "description": "[CONVERTED] Updated description",
-                "status": {"name": "In Progress"},
-                "issuetype": {"name": "Bug"},
-                "priority": {"name": "High"},
-            },
-        }
-        issues_mixin.jira.get_issue.return_value = issue_data
+        """Test that update_issue converts markdown descriptions in fields or kwargs."""
+        issues_mixin.jira.get_issue.return_value = {"key": "TEST-123", "fields": {}}
 
-        # Update issue with multiple fields
-        markdown_description = "Updated description with **emphasis**"
         issue = issues_mixin.update_issue(
-            issue_key="TEST-123",
-            fields={
-                "summary": "Updated Summary",
-                "priority": {"name": "High"},
-            },
-            description=markdown_description,  # As kwarg
+            issue_key="TEST-123", fields=fields, **description_kwargs
         )
 
         # Verify markdown conversion was called
         issues_mixin._markdown_to_jira.assert_called_once_with(markdown_description)
 
-        # Verify all fields were updated correctly
-        expected_fields = {
-            "summary": "Updated Summary",
-            "priority": {"name": "High"},
-            "description": f"[CONVERTED] {markdown_description}",
-        }
+        # Verify the converted description was passed to API
         issues_mixin.jira.update_issue.assert_called_once_with(
             issue_key="TEST-123", update={"fields": expected_fields}
         )
@@ -224,39 +163,6 @@ class TestIssuesMarkdownConversion:
         # Verify result
         assert issue.key == "TEST-123"
 
-    def test_markdown_conversion_preserves_none_values(self, issues_mixin: IssuesMixin):
-        """Test that None descriptions are not converted."""
-        # Reset the mock to check for actual None handling
-        issues_mixin._markdown_to_jira = Mock(
-            side_effect=lambda x: f"[CONVERTED] {x}" if x else ""
-        )
-
-        # Mock create response
-        create_response = {"key": "TEST-123"}
-        issues_mixin.jira.create_issue.return_value = create_response
-
-        # Mock get_issue response
-        issues_mixin.jira.get_issue.return_value = {
-            "id": "12345",
-            "key": "TEST-123",
-            "fields": {"summary": "Test", "issuetype": {"name": "Task"}},
-        }
-
-        # Create issue with None description (shouldn't add description field)
-        issues_mixin.create_issue(
-            project_key="TEST",
-            summary="Test Issue",
-            issue_type="Task",
-            # description not provided (defaults to "")
-        )
-
-        # Verify markdown conversion was not called
-        issues_mixin._markdown_to_jira.assert_not_called()
-
-        # Verify no description field was added
-        call_args = issues_mixin.jira.create_issue.call_args[1]
-        assert "description" not in call_args["fields"]
-
     def test_create_issue_with_markdown_in_additional_fields(
         self, issues_mixin: IssuesMixin
     ):
@@ -270,13 +176,8 @@ class TestIssuesMarkdownConversion:
         )
 
         # Mock create response
-        create_response = {"key": "TEST-123"}
-        issues_mixin.jira.create_issue.return_value = create_response
-        issues_mixin.jira.get_issue.return_value = {
-            "id": "12345",
-            "key": "TEST-123",
-            "fields": {"summary": "Test", "issuetype": {"name": "Task"}},
-        }
+        issues_mixin.jira.create_issue.return_value = {"key": "TEST-123"}
+        issues_mixin.jira.get_issue.return_value = {"key": "TEST-123", "fields": {}}
 
         # Create issue with a custom field that happens to be named 'description'
         # This should NOT be converted as it's a different field
@@ -1,4 +1,5 @@
-from unittest.mock import MagicMock, Mock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 from requests.exceptions import HTTPError
@@ -7,43 +8,91 @@ from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira.links import LinksMixin
 from mcp_atlassian.models.jira import JiraIssueLinkType
 
+# get_issue_link_types requires a dict response but only reads from it, so the
+# link types themselves are frozen and shared across tests
+_LINK_TYPES_RESPONSE = {
+    "issueLinkTypes": (
+        MappingProxyType(
+            {
+                "id": "10000",
+                "name": "Blocks",
+                "inward": "is blocked by",
+                "outward": "blocks",
+            }
+        ),
+        MappingProxyType(
+            {
+                "id": "10001",
+                "name": "Duplicate",
+                "inward": "is duplicated by",
+                "outward": "duplicates",
+            }
+        ),
+    )
+}
+
+# Unauthorized API response; the links code only reads its status code
+_AUTH_RESPONSE = Mock(status_code=401)
+
+
+def _auth_error():
+    """Build a fresh unauthorized HTTPError, so no traceback carries over."""
+    return HTTPError(response=_AUTH_RESPONSE)
+
+
+# Remote link payloads; create_remote_issue_link only reads them
+_REMOTE_LINK_OK = MappingProxyType(
+    {
+        "object": MappingProxyType(
+            {
+                "url": "https://example.com/page",
+                "title": "Example Page",
+                "summary": "A test page",
+            }
+        ),
+        "relationship": "documentation",
+    }
+)
+_REMOTE_LINK_MISSING_OBJECT = MappingProxyType({"relationship": "documentation"})
+_REMOTE_LINK_MISSING_URL = MappingProxyType(
+    {"object": MappingProxyType({"title": "Example Page"})}
+)
+_REMOTE_LINK_MISSING_TITLE = MappingProxyType(
+    {"object": MappingProxyType({"url": "https://example.com/page"})}
+)
+
+
+def _fake_from_api_response(data):
+    """Stand in for JiraIssueLinkType.from_api_response, keeping only the name."""
+    return SimpleNamespace(name=data["name"])
+
+
+@pytest.fixture(scope="module")
+def _links_mixin_template(session_jira_config, session_atlassian_jira):
+    """Create a single LinksMixin shared by all tests in this module.
+
+    Tests only reconfigure the mocked Jira API, so the mixin is built once and
+    the ``links_mixin`` fixture hands it out with a freshly reset mock.
+    """
+    mixin = LinksMixin(config=session_jira_config)
+    mixin.jira = session_atlassian_jira
+    return mixin
+
 
 class TestLinksMixin:
     @pytest.fixture
-    def links_mixin(self, mock_config, mock_atlassian_jira):
-        mixin = LinksMixin(config=mock_config)
-        mixin.jira = mock_atlassian_jira
-        return mixin
+    def links_mixin(self, _links_mixin_template, mock_atlassian_jira):
+        # mock_atlassian_jira resets the shared session mock for each test
+        return _links_mixin_template
 
-    def test_get_issue_link_types_success(self, links_mixin):
+    def test_get_issue_link_types_success(self, links_mixin, monkeypatch):
         """Test successful retrieval of issue link types."""
-        mock_response = {
-            "issueLinkTypes": [
-                {
-                    "id": "10000",
-                    "name": "Blocks",
-                    "inward": "is blocked by",
-                    "outward": "blocks",
-                },
-                {
-                    "id": "10001",
-                    "name": "Duplicate",
-                    "inward": "is duplicated by",
-                    "outward": "duplicates",
-                },
-            ]
-        }
-        links_mixin.jira.get.return_value = mock_response
-
-        def fake_from_api_response(data):
-            mock = MagicMock()
-            mock.name = data["name"]
-            return mock
+        links_mixin.jira.get.return_value = _LINK_TYPES_RESPONSE
+        monkeypatch.setattr(
+            JiraIssueLinkType, "from_api_response", _fake_from_api_response
+        )
 
-        with patch.object(
-            JiraIssueLinkType, "from_api_response", side_effect=fake_from_api_response
-        ):
-            result = links_mixin.get_issue_link_types()
+        result = links_mixin.get_issue_link_types()
 
         assert len(result) == 2
         assert result[0].name == "Blocks"
@@ -51,7 +100,7 @@ class TestLinksMixin:
         links_mixin.jira.get.assert_called_once_with("rest/api/2/issueLinkType")
 
     def test_get_issue_link_types_authentication_error(self, links_mixin):
-        links_mixin.jira.get.side_effect = HTTPError(response=Mock(status_code=401))
+        links_mixin.jira.get.side_effect = _auth_error()
 
         with pytest.raises(MCPAtlassianAuthenticationError):
             links_mixin.get_issue_link_types()
@@ -90,25 +139,15 @@ class TestLinksMixin:
             "inwardIssue": {"key": "PROJ-123"},
             "outwardIssue": {"key": "PROJ-456"},
         }
-        links_mixin.jira.create_issue_link.side_effect = HTTPError(
-            response=Mock(status_code=401)
-        )
+        links_mixin.jira.create_issue_link.side_effect = _auth_error()
 
         with pytest.raises(MCPAtlassianAuthenticationError):
             links_mixin.create_issue_link(data)
 
     def test_create_remote_issue_link_success(self, links_mixin):
         issue_key = "PROJ-123"
-        link_data = {
-            "object": {
-                "url": "https://example.com/page",
-                "title": "Example Page",
-                "summary": "A test page",
-            },
-            "relationship": "documentation",
-        }
 
-        response = links_mixin.create_remote_issue_link(issue_key, link_data)
+        response = links_mixin.create_remote_issue_link(issue_key, _REMOTE_LINK_OK)
 
         assert response["success"] is True
         assert response["issue_key"] == issue_key
@@ -116,47 +155,50 @@ class TestLinksMixin:
         assert response["link_url"] == "https://example.com/page"
         assert response["relationship"] == "documentation"
         links_mixin.jira.post.assert_called_once_with(
-            "rest/api/3/issue/PROJ-123/remotelink", json=link_data
+            "rest/api/3/issue/PROJ-123/remotelink", json=_REMOTE_LINK_OK
         )
 
-    def test_create_remote_issue_link_missing_issue_key(self, links_mixin):
-        link_data = {
-            "object": {"url": "https://example.com/page", "title": "Example Page"}
-        }
-
-        with pytest.raises(ValueError, match="Issue key is required"):
-            links_mixin.create_remote_issue_link("", link_data)
-
-    def test_create_remote_issue_link_missing_object(self, links_mixin):
-        issue_key = "PROJ-123"
-        link_data = {"relationship": "documentation"}
-
-        with pytest.raises(ValueError, match="Link object is required"):
-            links_mixin.create_remote_issue_link(issue_key, link_data)
-
-    def test_create_remote_issue_link_missing_url(self, links_mixin):
-        issue_key = "PROJ-123"
-        link_data = {"object": {"title": "Example Page"}}
-
-        with pytest.raises(ValueError, match="URL is required in link object"):
-            links_mixin.create_remote_issue_link(issue_key, link_data)
-
-    def test_create_remote_issue_link_missing_title(self, links_mixin):
-        issue_key = "PROJ-123"
-        link_data = {"object": {"url": "https://example.com/page"}}
-
-        with pytest.raises(ValueError, match="Title is required in link object"):
+    @pytest.mark.parametrize(
+        ("issue_key", "link_data", "match"),
+        [
+            pytest.param(
+                "",
+                _REMOTE_LINK_OK,
+                "Issue key is required",
+                id="missing-issue-key",
+            ),
+            pytest.param(
+                "PROJ-123",
+                _REMOTE_LINK_MISSING_OBJECT,
+                "Link object is required",
+                id="missing-object",
+            ),
+            pytest.param(
+                "PROJ-123",
+                _REMOTE_LINK_MISSING_URL,
+                "URL is required in link object",
+                id="missing-url",
+            ),
+            pytest.param(
+                "PROJ-123",
+                _REMOTE_LINK_MISSING_TITLE,
+                "Title is required in link object",
+                id="missing-title",
+            ),
+        ],
+    )
+    def test_create_remote_issue_link_validation(
+        self, links_mixin, issue_key, link_data, match
+    ):
+        with pytest.raises(ValueError, match=match):
             links_mixin.create_remote_issue_link(issue_key, link_data)
 
     def test_create_remote_issue_link_authentication_error(self, links_mixin):
         issue_key = "PROJ-123"
-        link_data = {
-            "object": {"url": "https://example.com/page", "title": "Example Page"}
-        }
-        links_mixin.jira.post.side_effect = HTTPError(response=Mock(status_code=401))
+        links_mixin.jira.post.side_effect = _auth_error()
 
         with pytest.raises(MCPAtlassianAuthenticationError):
-            links_mixin.create_remote_issue_link(issue_key, link_data)
+            links_mixin.create_remote_issue_link(issue_key, _REMOTE_LINK_OK)
 
     def test_remove_issue_link_success(self, links_mixin):
         link_id = "10000"
@@ -173,9 +215,7 @@ class TestLinksMixin:
 
     def test_remove_issue_link_authentication_error(self, links_mixin):
         link_id = "10000"
-        links_mixin.jira.remove_issue_link.side_effect = HTTPError(
-            response=Mock(status_code=401)
-        )
+        links_mixin.jira.remove_issue_link.side_effect = _auth_error()
 
         with pytest.raises(MCPAtlassianAuthenticationError):
             links_mixin.remove_issue_link(link_id)
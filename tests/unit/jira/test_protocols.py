@@ -1,93 +1,147 @@
 """Tests for Jira protocol definitions."""
 
 import inspect
-from typing import Any, get_type_hints
+from typing import Any
+
+import pytest
 
 from mcp_atlassian.jira.protocols import (
     AttachmentsOperationsProto,
+    EpicOperationsProto,
+    FieldsOperationsProto,
+    IssueOperationsProto,
+    ProjectsOperationsProto,
+    SearchOperationsProto,
     UsersOperationsProto,
 )
 from mcp_atlassian.models.jira import JiraIssue
 from mcp_atlassian.models.jira.search import JiraSearchResult
 
+# Default ``fields`` of the issue and search protocol methods
+_DEFAULT_FIELDS = (
+    "summary,description,status,assignee,reporter,labels,"
+    "priority,created,updated,issuetype"
+)
+
+# Issue returned by the compliant get_issue, re-keyed for each call
+_TEMPLATE_ISSUE = JiraIssue(id="123", key="PLACEHOLDER", summary="Test Issue")
+
+
+class _CompliantAttachments:
+    def upload_attachments(
+        self, issue_key: str, file_paths: list[str]
+    ) -> dict[str, Any]:
+        return {"uploaded": len(file_paths)}
+
+
+class _NonCompliantAttachments:
+    def some_other_method(self):
+        pass
+
+
+class _CompliantIssues:
+    def get_issue(
+        self,
+        issue_key: str,
+        expand: str | None = None,
+        comment_limit: int | str | None = 10,
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = _DEFAULT_FIELDS,
+        properties: str | list[str] | None = None,
+        *,
+        update_history: bool = True,
+    ) -> JiraIssue:
+        return _TEMPLATE_ISSUE.model_copy(update={"key": issue_key})
+
+
+class _CompliantSearch:
+    def search_issues(
+        self,
+        jql: str,
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = _DEFAULT_FIELDS,
+        start: int = 0,
+        limit: int = 50,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+    ) -> JiraSearchResult:
+        return JiraSearchResult(total=0, start_at=start, max_results=limit, issues=[])
+
+
+class _CompliantUsers:
+    def _get_account_id(self, assignee: str) -> str:
+        return f"account-id-for-{assignee}"
+
+
+class _NonCompliantUsers:
+    pass
+
+
+# Compliant implementations of the protocol methods, with a sample call:
+# (protocol, method, implementation, call args, result type, result key)
+_IMPLEMENTATIONS = [
+    pytest.param(
+        AttachmentsOperationsProto,
+        "upload_attachments",
+        _CompliantAttachments,
+        ("TEST-1", ["file.txt"]),
+        dict,
+        None,
+        id="attachments",
+    ),
+    pytest.param(
+        IssueOperationsProto,
+        "get_issue",
+        _CompliantIssues,
+        ("TEST-1",),
+        JiraIssue,
+        "TEST-1",
+        id="issues",
+    ),
+    pytest.param(
+        SearchOperationsProto,
+        "search_issues",
+        _CompliantSearch,
+        ("project = TEST",),
+        JiraSearchResult,
+        None,
+        id="search",
+    ),
+]
+
+# The (protocol, method, implementation) part of each case, for the contract
+# validation tests
+_CONTRACTS = [pytest.param(*case.values[:3], id=case.id) for case in _IMPLEMENTATIONS]
+
 
 class TestProtocolCompliance:
     """Tests for protocol compliance checking."""
 
-    def test_compliant_attachments_implementation(self):
-        """Test compliant attachments implementation."""
-
-        class CompliantAttachments:
-            def upload_attachments(
-                self, issue_key: str, file_paths: list[str]
-            ) -> dict[str, Any]:
-                return {"uploaded": len(file_paths)}
-
-        instance = CompliantAttachments()
-        assert hasattr(instance, "upload_attachments")
-        assert callable(instance.upload_attachments)
-
-    def test_compliant_issue_implementation(self):
-        """Test compliant issue implementation."""
-
-        class CompliantIssues:
-            def get_issue(
-                self,
-                issue_key: str,
-                expand: str | None = None,
-                comment_limit: int | str | None = 10,
-                fields: str | list[str] | tuple[str, ...] | set[str] | None = (
-                    "summary,description,status,assignee,reporter,labels,"
-                    "priority,created,updated,issuetype"
-                ),
-                properties: str | list[str] | None = None,
-                *,
-                update_history: bool = True,
-            ) -> JiraIssue:
-                return JiraIssue(id="123", key=issue_key, summary="Test Issue")
-
-        instance = CompliantIssues()
-        assert hasattr(instance, "get_issue")
-        result = instance.get_issue("TEST-1")
-        assert isinstance(result, JiraIssue)
-        assert result.key == "TEST-1"
-
-    def test_compliant_search_implementation(self):
-        """Test compliant search implementation."""
-
-        class CompliantSearch:
-            def search_issues(
-                self,
-                jql: str,
-                fields: str | list[str] | tuple[str, ...] | set[str] | None = (
-                    "summary,description,status,assignee,reporter,labels,"
-                    "priority,created,updated,issuetype"
-                ),
-                start: int = 0,
-                limit: int = 50,
-                expand: str | None = None,
-                projects_filter: str | None = None,
-            ) -> JiraSearchResult:
-                return JiraSearchResult(
-                    total=0, start_at=start, max_results=limit, issues=[]
-                )
-
-        instance = CompliantSearch()
-        result = instance.search_issues("project = TEST")
-        assert isinstance(result, JiraSearchResult)
+    @pytest.mark.parametrize(
+        (
+            "protocol_class",
+            "method_name",
+            "impl_cls",
+            "args",
+            "result_type",
+            "expected_key",
+        ),
+        _IMPLEMENTATIONS,
+    )
+    def test_compliant_implementation(
+        self, protocol_class, method_name, impl_cls, args, result_type, expected_key
+    ):
+        """Test compliant implementations of the protocol methods."""
+        assert method_name in protocol_class.__abstractmethods__
+        method = getattr(impl_cls(), method_name)
+        assert callable(method)
+
+        result = method(*args)
+        assert isinstance(result, result_type)
+        assert getattr(result, "key", None) == expected_key
 
     def test_runtime_checkable_users_protocol(self):
         """Test runtime checking for UsersOperationsProto."""
-
-        class CompliantUsers:
-            def _get_account_id(self, assignee: str) -> str:
-                return f"account-id-for-{assignee}"
-
-        class NonCompliantUsers:
-            pass
-
-        compliant_instance = CompliantUsers()
-        non_compliant_instance = NonCompliantUsers()
+        compliant_instance = _CompliantUsers()
+        non_compliant_instance = _NonCompliantUsers()
 
         # Runtime checkable only checks method existence
         assert isinstance(compliant_instance, UsersOperationsProto)
@@ -97,7 +151,44 @@ class TestProtocolCompliance:
 class TestProtocolContractValidation:
     """Tests for validating protocol contract compliance."""
 
-    def test_method_signature_validation(self):
+    @pytest.mark.parametrize(
+        ("protocol_class", "expected_methods"),
+        [
+            (AttachmentsOperationsProto, frozenset({"upload_attachments"})),
+            (IssueOperationsProto, frozenset({"get_issue"})),
+            (SearchOperationsProto, frozenset({"search_issues"})),
+            (
+                EpicOperationsProto,
+                frozenset(
+                    {
+                        "update_epic_fields",
+                        "prepare_epic_fields",
+                        "_try_discover_fields_from_existing_epic",
+                    }
+                ),
+            ),
+            (
+                FieldsOperationsProto,
+                frozenset(
+                    {
+                        "_generate_field_map",
+                        "get_field_by_id",
+                        "get_field_ids_to_epic",
+                        "get_required_fields",
+                    }
+                ),
+            ),
+            (ProjectsOperationsProto, frozenset({"get_project_issue_types"})),
+            (UsersOperationsProto, frozenset({"_get_account_id"})),
+        ],
+        ids=["attachments", "issues", "search", "epics", "fields", "projects", "users"],
+    )
+    def test_abstract_methods(self, protocol_class, expected_methods):
+        """Test each protocol declares exactly the expected abstract methods."""
+        assert protocol_class.__abstractmethods__ == expected_methods
+
+    @pytest.mark.parametrize(("protocol_class", "method_name", "impl_cls"), _CONTRACTS)
+    def test_method_signature_validation(self, protocol_class, method_name, impl_cls):
         """Test method signature validation helper."""
 
         def validate_method_signature(protocol_class, method_name: str, implementation):
@@ -114,78 +205,41 @@ class TestProtocolContractValidation:
 
             return protocol_params == impl_params
 
-        class TestImplementation:
-            def upload_attachments(
-                self, issue_key: str, file_paths: list[str]
-            ) -> dict[str, Any]:
-                return {}
-
-        impl = TestImplementation()
-        assert validate_method_signature(
-            AttachmentsOperationsProto, "upload_attachments", impl
-        )
+        assert validate_method_signature(protocol_class, method_name, impl_cls())
 
-    def test_type_hint_validation(self):
+    @pytest.mark.parametrize(("protocol_class", "method_name", "impl_cls"), _CONTRACTS)
+    def test_type_hint_validation(self, protocol_class, method_name, impl_cls):
         """Test type hint compliance validation."""
 
         def validate_type_hints(protocol_class, method_name: str, implementation):
             """Validate type hints match between protocol and implementation."""
-            protocol_method = getattr(protocol_class, method_name)
-            impl_method = getattr(implementation, method_name)
-
-            protocol_hints = get_type_hints(protocol_method)
-            impl_hints = get_type_hints(impl_method)
+            # Neither module defers annotations, so they are already resolved
+            protocol_hints = getattr(protocol_class, method_name).__annotations__
+            impl_hints = getattr(implementation, method_name).__annotations__
 
             # Check return type
             return protocol_hints.get("return") == impl_hints.get("return")
 
-        class TypeCompliantImplementation:
-            def upload_attachments(
-                self, issue_key: str, file_paths: list[str]
-            ) -> dict[str, Any]:
-                return {}
-
-        impl = TypeCompliantImplementation()
-        assert validate_type_hints(
-            AttachmentsOperationsProto, "upload_attachments", impl
-        )
+        assert validate_type_hints(protocol_class, method_name, impl_cls())
 
     def test_structural_compliance_check(self):
         """Test structural typing validation."""
 
         def check_structural_compliance(instance, protocol_class):
             """Check if instance structurally complies with protocol."""
-            abstract_methods = []
-            for attr_name in dir(protocol_class):
-                if not attr_name.startswith("__"):
-                    attr = getattr(protocol_class, attr_name, None)
-                    if (
-                        callable(attr)
-                        and hasattr(attr, "__isabstractmethod__")
-                        and attr.__isabstractmethod__
-                    ):
-                        abstract_methods.append(attr_name)
-
-            # Check if instance has all required methods
-            for method_name in abstract_methods:
-                if not hasattr(instance, method_name):
+            # Check if instance has all required (abstract) methods
+            for method_name in protocol_class.__abstractmethods__:
+                # Look the method up without running descriptors or __getattr__
+                try:
+                    attr = inspect.getattr_static(instance, method_name)
+                except AttributeError:
                     return False
-                if not callable(getattr(instance, method_name)):
+                if not callable(attr):
                     return False
             return True
 
-        class CompliantImplementation:
-            def upload_attachments(
-                self, issue_key: str, file_paths: list[str]
-            ) -> dict[str, Any]:
-                return {}
-
-        class NonCompliantImplementation:
-            def some_other_method(self):
-                pass
-
-        compliant = CompliantImplementation()
-        non_compliant = NonCompliantImplementation()
+        compliant = _CompliantAttachments()
+        non_compliant = _NonCompliantAttachments()
 
         assert check_structural_compliance(compliant, AttachmentsOperationsProto)
         assert not check_structural_compliance(
@@ -12,19 +12,6 @@ from typing import Any
 import pytest
 
 from mcp_atlassian.utils.env import is_env_truthy
-from tests.fixtures.confluence_mocks import (
-    MOCK_COMMENTS_RESPONSE,
-    MOCK_CQL_SEARCH_RESPONSE,
-    MOCK_LABELS_RESPONSE,
-    MOCK_PAGE_RESPONSE,
-)
-
-# Import mock data
-from tests.fixtures.jira_mocks import (
-    MOCK_JIRA_COMMENTS,
-    MOCK_JIRA_ISSUE_RESPONSE,
-    MOCK_JIRA_JQL_RESPONSE,
-)
 from tests.utils.factories import (
     ConfluencePageFactory,
     ErrorResponseFactory,
@@ -36,7 +23,7 @@ from tests.utils.factories import (
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_jira_issue_data():
     """
     Factory fixture for creating Jira issue data for model testing.
@@ -59,7 +46,7 @@ def make_jira_issue_data():
     return JiraIssueFactory.create
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_confluence_page_data():
     """
     Factory fixture for creating Confluence page data for model testing.
@@ -79,7 +66,7 @@ def make_confluence_page_data():
     return ConfluencePageFactory.create
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_error_response_data():
     """
     Factory fixture for creating error response data for model testing.
@@ -103,8 +90,11 @@ def make_error_response_data():
 # Compatibility Fixtures (using legacy mock data)
 # ============================================================================
 
+# The mock data modules are imported on first use, so model test runs that never
+# request these fixtures skip loading them.
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def jira_issue_data() -> dict[str, Any]:
     """
     Return mock Jira issue data.
@@ -112,40 +102,48 @@ def jira_issue_data() -> dict[str, Any]:
     Note: This fixture is maintained for backward compatibility.
     Consider using make_jira_issue_data for new tests.
     """
+    from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE
+
     return MOCK_JIRA_ISSUE_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def jira_search_data() -> dict[str, Any]:
     """
     Return mock Jira search (JQL) results.
 
     Note: This fixture is maintained for backward compatibility.
     """
+    from tests.fixtures.jira_mocks import MOCK_JIRA_JQL_RESPONSE
+
     return MOCK_JIRA_JQL_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def jira_comments_data() -> dict[str, Any]:
     """
     Return mock Jira comments data.
 
     Note: This fixture is maintained for backward compatibility.
     """
+    from tests.fixtures.jira_mocks import MOCK_JIRA_COMMENTS
+
     return MOCK_JIRA_COMMENTS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def confluence_search_data() -> dict[str, Any]:
     """
     Return mock Confluence search (CQL) results.
 
     Note: This fixture is maintained for backward compatibility.
     """
+    from tests.fixtures.confluence_mocks import MOCK_CQL_SEARCH_RESPONSE
+
     return MOCK_CQL_SEARCH_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def confluence_page_data() -> dict[str, Any]:
     """
     Return mock Confluence page data.
@@ -153,26 +151,32 @@ def confluence_page_data() -> dict[str, Any]:
     Note: This fixture is maintained for backward compatibility.
     Consider using make_confluence_page_data for new tests.
     """
+    from tests.fixtures.confluence_mocks import MOCK_PAGE_RESPONSE
+
     return MOCK_PAGE_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def confluence_comments_data() -> dict[str, Any]:
     """
     Return mock Confluence comments data.
 
     Note: This fixture is maintained for backward compatibility.
     """
+    from tests.fixtures.confluence_mocks import MOCK_COMMENTS_RESPONSE
+
     return MOCK_COMMENTS_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def confluence_labels_data() -> dict[str, Any]:
     """
     Return mock Confluence labels data.
 
     Note: This fixture is maintained for backward compatibility.
     """
+    from tests.fixtures.confluence_mocks import MOCK_LABELS_RESPONSE
+
     return MOCK_LABELS_RESPONSE
 
 
@@ -181,7 +185,7 @@ def confluence_labels_data() -> dict[str, Any]:
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complete_jira_issue_data():
     """
     Fixture providing complete Jira issue data with all fields populated.
@@ -225,7 +229,7 @@ def complete_jira_issue_data():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_jira_issue_data():
     """
     Fixture providing minimal Jira issue data for edge case testing.
@@ -238,7 +242,7 @@ def minimal_jira_issue_data():
     return JiraIssueFactory.create_minimal("MINIMAL-123")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complete_confluence_page_data():
     """
     Fixture providing complete Confluence page data with all fields populated.
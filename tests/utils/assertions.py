@@ -86,3 +86,19 @@ def assert_dict_subset(subset: dict[str, Any], full_dict: dict[str, Any]) -> Non
             assert full_dict[key] == value, (
                 f"Key '{key}': expected {value}, got {full_dict[key]}"
             )
+
+
+def assert_oauth_client_initialized(
+    mock_client_cls: MagicMock,
+    mock_configure_oauth: MagicMock,
+    mock_configure_ssl: MagicMock,
+    cloud_id: str,
+) -> None:
+    """Assert a Jira client was built for OAuth through the cloud API."""
+    mock_configure_oauth.assert_called_once()
+    mock_client_cls.assert_called_once()
+    client_kwargs = mock_client_cls.call_args.kwargs
+    assert client_kwargs["url"] == f"https://api.atlassian.com/ex/jira/{cloud_id}"
+    assert "session" in client_kwargs
+    assert client_kwargs["cloud"] is True
+    mock_configure_ssl.assert_called_once()